@@ -52,7 +52,7 @@ def main():
 
     # Save the results to a file
     with open("best_of_n_results.json", "w") as f:
-        json.dump(result, f, indent=2)
+        json.dump(result.to_dict(), f, indent=2)
 
     print("\nResults saved to best_of_n_results.json")
 
@@ -49,7 +49,7 @@ def main():
 
     # Save the results to a file
     with open("api_quickstart_results.json", "w") as f:
-        json.dump(result, f, indent=2)
+        json.dump(result.to_dict(), f, indent=2)
 
     print("\nResults saved to api_quickstart_results.json")
 
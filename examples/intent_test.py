@@ -71,7 +71,7 @@ def run_test_with_model(model, problem_statement, model_name):
         # Save the results to a file
         output_file = f"plangen_results_{model_name.lower().replace(' ', '_')}.json"
         with open(output_file, "w") as f:
-            json.dump(result, f, indent=2)
+            json.dump(result.to_dict(), f, indent=2)
 
         print(f"\nResults saved to {output_file}")
 
@@ -184,7 +184,7 @@ def main():
 
         # Save the results to a file
         with open("plangen_bedrock_result.json", "w") as f:
-            json.dump(result, f, indent=2)
+            json.dump(result.to_dict(), f, indent=2)
 
         print("\nResults saved to plangen_bedrock_result.json")
 
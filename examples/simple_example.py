@@ -71,7 +71,7 @@ def main():
 
     # Save the results to a file
     with open("plangen_results.json", "w") as f:
-        json.dump(result, f, indent=2)
+        json.dump(result.to_dict(), f, indent=2)
 
     print("\nResults saved to plangen_results.json")
 
@@ -84,7 +84,7 @@ def main():
 
         # Save the results to a file
         with open("calendar_scheduling_openai_result.json", "w") as f:
-            json.dump(result, f, indent=2)
+            json.dump(result.to_dict(), f, indent=2)
 
         print("\nResults saved to calendar_scheduling_openai_result.json")
 
@@ -1,6 +1,6 @@
 """Example demonstrating the use of typed API results.
 
-This example shows how to use the new TypedDict types for better type safety
+This example shows how to use the typed result classes for better type safety
 and IDE autocompletion when working with PlanGEN results.
 """
 
@@ -15,12 +15,12 @@ def example_with_typed_results() -> None:
     # The solve method now returns a typed result
     # result: SolveResult = plangen.solve("Design a sorting algorithm")
 
-    # With TypedDict, IDEs can provide autocompletion for available keys
-    # print(f"Problem: {result['problem']}")
-    # print(f"Selected Solution: {result['selected_solution']}")
-    # print(f"Score: {result['score']}")
+    # Result fields are attributes, so IDEs can autocomplete them
+    # print(f"Problem: {result.problem}")
+    # print(f"Selected Solution: {result.selected_solution}")
+    # print(f"Score: {result.score}")
 
-    # You can also destructure the result
+    # Key access is still supported for existing code
     # problem = result["problem"]
     # solution = result["selected_solution"]
     # score = result["score"]
@@ -43,12 +43,12 @@ def example_with_verification() -> None:
     # )
 
     # When using a custom verifier that returns VerificationResult
-    # result: VerificationResult = {
-    #     "is_valid": True,
-    #     "score": 85.5,
-    #     "reason": "Solution meets requirements",
-    #     "feedback": "Good work"
-    # }
+    # result = VerificationResult(
+    #     is_valid=True,
+    #     score=85.5,
+    #     reason="Solution meets requirements",
+    #     feedback="Good work",
+    # )
 
     print("Example demonstrating typed verification usage")
     print("See the docstring for usage patterns")
@@ -12,10 +12,12 @@ from .agents import (ConstraintAgent, SelectionAgent, SolutionAgent,
                      VerificationAgent)
 from .api import Algorithm, PlanGen, Verifiers, Visualization
 from .plangen import PlanGEN
-from .types import AlgorithmResult, PlanResult, SolveResult, VerificationResult
+from .types import (AgentResult, AlgorithmResult, PlanResult, SolveResult,
+                    StreamUpdate, VerificationResult)
 from .visualization import GraphRenderer, Observable, PlanObserver
 
 __all__ = [
+    "AgentResult",
     "Algorithm",
     "AlgorithmResult",
     "ConstraintAgent",
@@ -30,6 +32,7 @@ __all__ = [
     "SelectionAgent",
     "SolutionAgent",
     "SolveResult",
+    "StreamUpdate",
     "VerificationAgent",
     "VerificationResult",
     "Verifiers",
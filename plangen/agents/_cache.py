@@ -0,0 +1,147 @@
+"""Content-addressed cache for constraint extraction results."""
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from typing_extensions import Self
+
+
+# Default number of extraction results kept in memory
+DEFAULT_CACHE_SIZE = 512
+
+# Names of the files the cache writes to cache_dir: the key, then .json (or
+# .tmp while being written)
+_ENTRY_FILE_RE = re.compile(r"[0-9a-f]{64}\.(?:json|tmp)")
+
+
+def cache_key(model_name: str, system_message: str, prompt: str) -> str:
+    """Build a cache key for one model call.
+
+    The rendered prompt already contains the problem, and hashing it (rather
+    than the bare problem) also invalidates entries when a template changes.
+
+    Args:
+        model_name: Name of the model answering the prompt
+        system_message: System message sent with the prompt
+        prompt: Rendered prompt
+
+    Returns:
+        Hex SHA-256 digest identifying the call
+    """
+    digest = hashlib.sha256()
+    for part in (model_name, system_message, prompt):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """Thread-safe LRU cache of model responses, optionally persisted as JSON."""
+
+    def __init__(
+        self: Self,
+        maxsize: int = DEFAULT_CACHE_SIZE,
+        cache_dir: str | Path | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept in memory
+            cache_dir: Directory for persisting entries as JSON files, or None
+                to keep them in memory only
+        """
+        self.maxsize = maxsize
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self: Self) -> int:
+        """Return the number of entries held in memory."""
+        return len(self._entries)
+
+    def get(self: Self, key: str) -> str | None:
+        """Look up a cached response.
+
+        Args:
+            key: Key from cache_key()
+
+        Returns:
+            The cached response, or None on a miss
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        path = self._path(key)
+        if path is None:
+            return None
+        try:
+            value = json.loads(path.read_text())["value"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        self._remember(key, value)
+        return value
+
+    def set(self: Self, key: str, value: str) -> None:
+        """Store a response.
+
+        The entry is always kept in memory; failing to persist it to
+        cache_dir is not an error.
+
+        Args:
+            key: Key from cache_key()
+            value: Response to cache
+        """
+        self._remember(key, value)
+
+        path = self._path(key)
+        if path is None:
+            return
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps({"value": value}))
+            tmp_path.replace(path)
+        except OSError:
+            return
+
+    def clear(self: Self) -> None:
+        """Remove all entries, including any persisted to cache_dir.
+
+        Only files the cache wrote are removed from cache_dir.
+        """
+        with self._lock:
+            self._entries.clear()
+
+        if self.cache_dir is not None and self.cache_dir.is_dir():
+            for path in self.cache_dir.iterdir():
+                if _ENTRY_FILE_RE.fullmatch(path.name):
+                    path.unlink(missing_ok=True)
+
+    def _remember(self: Self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _path(self: Self, key: str) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{key}.json"
+
+
+# Cache shared by agents created with use_cache=True and no cache_dir
+_shared_cache = ExtractionCache()
+
+
+def clear_cache() -> None:
+    """Clear the shared in-memory extraction cache."""
+    _shared_cache.clear()
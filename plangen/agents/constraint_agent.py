@@ -1,15 +1,24 @@
 """Constraint agent for PlanGEN."""
 from __future__ import annotations
 
+import re
 from typing import TYPE_CHECKING
 from typing_extensions import Self
 
+from . import _cache
+
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from plangen.models import BaseModelInterface
     from plangen.prompts import PromptManager
 
 
+# List item prefixed by "1.", "1)", "-" or "*"; captures the item text
+_BULLET_RE = re.compile(r"^[ \t]*(?:\d+[.)]|[-*])[ \t]+(.+?)[ \t]*$", re.MULTILINE)
+
+
 class ConstraintAgent:
     """Agent for extracting constraints from problem statements."""
 
@@ -17,15 +26,45 @@ class ConstraintAgent:
         self: Self,
         model: BaseModelInterface,
         prompt_manager: PromptManager,
+        use_cache: bool = False,
+        cache_dir: str | Path | None = None,
     ) -> None:
         """Initialize the constraint agent.
 
         Args:
             model: Model interface for generating responses
             prompt_manager: Manager for prompt templates
+            use_cache: Whether to reuse the model's answer when the same
+                problem is extracted again with the same model and prompts
+            cache_dir: Directory in which to persist cached answers as JSON;
+                implies use_cache
         """
         self.model = model
         self.prompt_manager = prompt_manager
+        if cache_dir is not None:
+            self.cache: _cache.ExtractionCache | None = _cache.ExtractionCache(
+                cache_dir=cache_dir,
+            )
+        elif use_cache:
+            self.cache = _cache._shared_cache
+        else:
+            self.cache = None
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Clear the in-memory extraction cache shared between agents."""
+        _cache.clear_cache()
+
+    def run(self: Self, problem: str) -> list[str]:
+        """Extract constraints from a problem statement as a list.
+
+        Args:
+            problem: Problem statement
+
+        Returns:
+            List of extracted constraints
+        """
+        return self.parse_constraints(self.extract_constraints(problem))
 
     def extract_constraints(self: Self, problem: str) -> str:
         """Extract constraints from a problem statement.
@@ -42,6 +81,35 @@ class ConstraintAgent:
             "constraint_extraction", problem=problem,
         )
 
-        # Generate constraints using the model
-        return self.model.generate(prompt, system_message=system_message)
+        if self.cache is None:
+            return self.model.generate(prompt, system_message=system_message)
+
+        model_name = getattr(self.model, "model_name", None) or getattr(
+            self.model, "model_id", type(self.model).__name__,
+        )
+        key = _cache.cache_key(str(model_name), str(system_message), str(prompt))
+        constraints = self.cache.get(key)
+        if constraints is None:
+            # Generate constraints using the model
+            constraints = self.model.generate(prompt, system_message=system_message)
+            self.cache.set(key, constraints)
+        return constraints
+
+    @staticmethod
+    def parse_constraints(constraints: str) -> list[str]:
+        """Split a constraint listing into individual constraints.
 
+        Numbered ("1." or "1)") and bulleted ("-" or "*") items are recognised.
+        If the text contains no list items, each non-empty line is treated as
+        a constraint.
+
+        Args:
+            constraints: Constraints as returned by extract_constraints
+
+        Returns:
+            List of constraints
+        """
+        items = _BULLET_RE.findall(constraints)
+        if items:
+            return items
+        return [line.strip() for line in constraints.splitlines() if line.strip()]
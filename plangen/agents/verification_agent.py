@@ -1,12 +1,46 @@
 """Verification agent for PlanGEN."""
+from __future__ import annotations
 
+import re
+from concurrent.futures import ThreadPoolExecutor
 
 from typing_extensions import Self
 
+import jinja2
+
 from plangen.models import BaseModelInterface
 from plangen.prompts import PromptManager
 
 
+# Default upper bound on concurrent per-solution verification calls
+MAX_PARALLEL_VERIFICATIONS = 8
+
+# Candidate header line opening a verification in a batched verification
+# response, e.g. "### Solution 1", "**Solution 1**" or "Solution 1 verification:"
+_SOLUTION_HEADER_RE = re.compile(
+    r"^[ \t]*(?P<marks>#*)[ \t]*[*_]*[ \t]*Solution[ \t]+(?P<number>\d+)\b"
+    r"(?P<rest>.*)$",
+    re.MULTILINE,
+)
+
+
+def _is_solution_header(match: re.Match[str]) -> bool:
+    """Tell a section header from body text that mentions a solution.
+
+    Markdown headings are always headers. Other lines are headers only if
+    nothing but emphasis and colons follows the number, or they end with a
+    colon, so a sentence like "Solution 1 meets all constraints." is not.
+
+    Args:
+        match: Match of _SOLUTION_HEADER_RE
+
+    Returns:
+        True if the matched line is a section header
+    """
+    rest = match["rest"].rstrip()
+    return bool(match["marks"]) or not rest.strip(" \t*_:") or rest.endswith(":")
+
+
 class VerificationAgent:
     """Agent for verifying plans and solutions."""
 
@@ -14,21 +48,37 @@ class VerificationAgent:
         self: Self,
         model: BaseModelInterface,
         prompt_manager: PromptManager,
+        max_parallel_verifications: int = MAX_PARALLEL_VERIFICATIONS,
     ) -> None:
         """Initialize the verification agent.
 
         Args:
             model: Model interface for generating responses
             prompt_manager: Manager for prompt templates
+            max_parallel_verifications: Maximum number of per-solution
+                verification calls to run at once
         """
+        if max_parallel_verifications < 1:
+            msg = (
+                "max_parallel_verifications must be at least 1, "
+                f"got {max_parallel_verifications}"
+            )
+            raise ValueError(msg)
+
         self.model = model
         self.prompt_manager = prompt_manager
+        self.max_parallel_verifications = max_parallel_verifications
 
     def verify_solutions(
         self: Self, solutions: list[str], constraints: str,
     ) -> list[str]:
         """Verify multiple solutions against constraints.
 
+        All solutions are verified with a single batched prompt. If the batched
+        prompt is unavailable, or the model's response cannot be split into one
+        verification per solution, each solution is verified individually
+        instead, with the calls issued concurrently.
+
         Args:
             solutions: List of solutions to verify
             constraints: Extracted constraints
@@ -39,15 +89,112 @@ class VerificationAgent:
         # Get the system message for verification
         system_message = self.prompt_manager.get_system_message("verification")
 
-        # Verify each solution
-        verification_results = []
-        for solution in solutions:
-            prompt = self.prompt_manager.get_prompt(
-                "solution_verification",
-                solution=solution,
+        if len(solutions) <= 1:
+            return [
+                self._verify_one(solution, constraints, system_message)
+                for solution in solutions
+            ]
+
+        prompt = self._batch_prompt(solutions, constraints)
+        if prompt is not None:
+            response = self.model.generate(prompt, system_message=system_message)
+            verification_results = self._split_batch_response(
+                response, len(solutions),
+            )
+            if verification_results is not None:
+                return verification_results
+
+        # Verify each solution concurrently; map preserves the input order
+        max_workers = min(self.max_parallel_verifications, len(solutions))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda solution: self._verify_one(
+                        solution, constraints, system_message,
+                    ),
+                    solutions,
+                ),
+            )
+
+    def _batch_prompt(
+        self: Self, solutions: list[str], constraints: str,
+    ) -> str | None:
+        """Render the batched verification prompt, if it should be used.
+
+        A customized solution_verification prompt is only honored by the
+        per-solution path, so batching is skipped unless the batched prompt is
+        customized too. Template directories without the batched template also
+        fall back to per-solution verification.
+
+        Args:
+            solutions: List of solutions to verify
+            constraints: Extracted constraints
+
+        Returns:
+            Rendered prompt, or None to verify each solution individually
+        """
+        custom_prompts = getattr(self.prompt_manager, "custom_prompts", {})
+        if (
+            "solution_verification" in custom_prompts
+            and "solution_verification_batch" not in custom_prompts
+        ):
+            return None
+
+        try:
+            return self.prompt_manager.get_prompt(
+                "solution_verification_batch",
+                solutions=solutions,
                 constraints=constraints,
             )
-            verification = self.model.generate(prompt, system_message=system_message)
-            verification_results.append(verification)
+        except jinja2.TemplateNotFound:
+            return None
+
+    def _verify_one(
+        self: Self, solution: str, constraints: str, system_message: str,
+    ) -> str:
+        """Verify a single solution against constraints.
+
+        Args:
+            solution: Solution to verify
+            constraints: Extracted constraints
+            system_message: System message for verification
+
+        Returns:
+            Verification result
+        """
+        prompt = self.prompt_manager.get_prompt(
+            "solution_verification",
+            solution=solution,
+            constraints=constraints,
+        )
+        return self.model.generate(prompt, system_message=system_message)
+
+    @staticmethod
+    def _split_batch_response(response: str, count: int) -> list[str] | None:
+        """Split a batched verification response into per-solution results.
+
+        Args:
+            response: Model response to the batched verification prompt
+            count: Number of solutions that were verified
+
+        Returns:
+            List of verification results, or None if the response does not
+            contain exactly one section per solution in order
+        """
+        if not isinstance(response, str):
+            return None
+
+        headers = [
+            match
+            for match in _SOLUTION_HEADER_RE.finditer(response)
+            if _is_solution_header(match)
+        ]
+        numbers = [int(match["number"]) for match in headers]
+        if numbers != list(range(1, count + 1)):
+            return None
 
-        return verification_results
+        # Each verification runs from the end of its header to the next header
+        ends = [match.start() for match in headers[1:]] + [len(response)]
+        return [
+            response[match.end():end].strip() for match, end in zip(headers, ends)
+        ]
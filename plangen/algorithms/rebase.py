@@ -24,6 +24,7 @@ Example:
 """
 from __future__ import annotations
 
+import re
 from typing import Any
 from typing_extensions import Self
 
@@ -32,6 +33,9 @@ from plangen.utils.template_loader import TemplateLoader
 from .base_algorithm import BaseAlgorithm
 
 
+_NUMBER_RE = re.compile(r"\d+")
+
+
 class REBASE(BaseAlgorithm):
     """Implementation of the REBASE algorithm.
 
@@ -316,9 +320,7 @@ class REBASE(BaseAlgorithm):
                     score = float(score_text)
                 else:
                     # Fallback: try to find any number in the response
-                    import re
-
-                    numbers = re.findall(r"\d+", response)
+                    numbers = _NUMBER_RE.findall(response)
                     score = float(numbers[-1]) if numbers else 50
 
                 # Ensure score is in 0-100 range
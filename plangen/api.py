@@ -7,7 +7,7 @@ of the underlying implementation.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable, Iterator, Protocol
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterator, Protocol
 from typing_extensions import Self
 
 if TYPE_CHECKING:
@@ -332,6 +332,28 @@ class PlanGen:
         """
         yield from self._plangen.solve_stream(problem)
 
+    async def solve_stream_async(
+        self: Self,
+        problem: str,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Solve a problem using the PlanGEN workflow with async streaming.
+
+        Args:
+            problem: Problem statement to solve
+
+        Yields:
+            The same updates as solve_stream()
+
+        Example:
+            ```python
+            plangen = PlanGen.create(model="gpt-4o")
+            async for update in plangen.solve_stream_async("Your problem here"):
+                print(f"{update['step']}: {update['status']}")
+            ```
+        """
+        async for update in self._plangen.solve_stream_async(problem):
+            yield update
+
     def generate_plan(
         self: Self,
         problem: str,
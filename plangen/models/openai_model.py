@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import os
+import time
 from typing import Iterator
 from typing_extensions import Self
 
@@ -10,6 +11,11 @@ from tenacity import retry, stop_after_attempt, wait_random_exponential
 
 from .base_model import BaseModelInterface
 
+# Streaming deltas are coalesced until this many characters are buffered...
+STREAM_BUFFER_SIZE = 8192
+# ...or this many seconds have passed since the last yielded chunk
+STREAM_FLUSH_INTERVAL = 0.025
+
 
 class OpenAIModelInterface(BaseModelInterface):
     """Interface for interacting with OpenAI models."""
@@ -123,7 +129,10 @@ class OpenAIModelInterface(BaseModelInterface):
             max_tokens: Optional max tokens override
 
         Yields:
-            Chunks of generated text from the model
+            Chunks of generated text from the model. The first non-empty delta
+            is yielded as soon as it arrives; after that, consecutive deltas
+            that arrive within STREAM_FLUSH_INTERVAL seconds are joined into
+            one chunk of at most roughly STREAM_BUFFER_SIZE characters.
         """
         messages = []
 
@@ -140,6 +149,34 @@ class OpenAIModelInterface(BaseModelInterface):
             stream=True,
         )
 
+        # Coalesce small deltas to cut per-chunk overhead for the consumer
+        buffer: list[str] = []
+        buffered = 0
+        last_flush = time.monotonic()
+        first = True
         for chunk in stream:
-            if chunk.choices[0].delta.content is not None:
-                yield chunk.choices[0].delta.content
+            content = chunk.choices[0].delta.content
+            if content is None:
+                continue
+
+            # Yield the first token unbuffered to keep time-to-first-token low
+            if first and content:
+                yield content
+                first = False
+                last_flush = time.monotonic()
+                continue
+
+            buffer.append(content)
+            buffered += len(content)
+            now = time.monotonic()
+            if (
+                buffered >= STREAM_BUFFER_SIZE
+                or now - last_flush >= STREAM_FLUSH_INTERVAL
+            ):
+                yield "".join(buffer)
+                buffer.clear()
+                buffered = 0
+                last_flush = now
+
+        if buffer:
+            yield "".join(buffer)
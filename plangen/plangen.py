@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Any, Iterator, List, Optional, TypedDict
+import asyncio
+import copy
+import threading
+from collections import OrderedDict
+from typing import (Any, AsyncIterator, Callable, Generator, List, Literal,
+                    Mapping, Optional, TypedDict, cast, overload)
 from typing_extensions import Self
 
 from langgraph.graph import END, StateGraph
@@ -12,7 +17,59 @@ from .agents import (ConstraintAgent, SelectionAgent, SolutionAgent,
                      VerificationAgent)
 from .models import BaseModelInterface, OpenAIModelInterface
 from .prompts import PromptManager
-from .types import SolveResult
+from .types import AgentResult, SolveResult, StreamUpdate, make_solve_result
+
+# Sentinel marking the end of an async update stream
+_STREAM_END = object()
+
+
+# Workflow steps reported by solve_stream(), in order
+_STREAM_STEPS = (
+    "extract_constraints",
+    "generate_solutions",
+    "verify_solutions",
+    "select_solution",
+)
+
+
+def _dict_update(
+    step: str, status: str, data: dict[str, Any] | None, error: str | None = None,
+) -> dict[str, Any]:
+    update = {"step": step, "status": status, "data": data}
+    if error is not None:
+        update["error"] = error
+    return update
+
+
+# Update constructor for each solve_stream() stream_format
+_UPDATE_FACTORIES: dict[str, Callable[..., Any]] = {
+    "dict": _dict_update,
+    "tuple": StreamUpdate,
+}
+
+# In-progress updates shared by every solve_stream(stream_format="tuple") call.
+# Dict updates are built fresh, since callers may modify or serialize them.
+_IN_PROGRESS_TUPLES = {
+    step: StreamUpdate(step, "in_progress") for step in _STREAM_STEPS
+}
+
+
+def _as_agent_result(value: Any) -> AgentResult:
+    """Wrap an agent's return value in an AgentResult.
+
+    Agents may report failure by returning an AgentResult instead of raising;
+    any other return value is a successful result.
+
+    Args:
+        value: Value returned by the agent
+
+    Returns:
+        The value if it is already an AgentResult, otherwise a successful
+        AgentResult holding it
+    """
+    if isinstance(value, AgentResult):
+        return value
+    return AgentResult(ok=True, value=value)
 
 
 class PlanGENState(TypedDict):
@@ -34,6 +91,7 @@ class PlanGEN:
         model: BaseModelInterface | None = None,
         prompt_manager: PromptManager | None = None,
         num_solutions: int = 3,
+        plan_cache_size: int = 0,
     ) -> None:
         """Initialize the PlanGEN framework.
 
@@ -41,6 +99,8 @@ class PlanGEN:
             model: Model interface for generating responses
             prompt_manager: Manager for prompt templates
             num_solutions: Number of solutions to generate
+            plan_cache_size: Number of successful results to keep for reuse
+                when the same problem is solved again; 0 disables caching
         """
         # Use default model if not provided
         self.model = model or OpenAIModelInterface()
@@ -51,6 +111,11 @@ class PlanGEN:
         # Number of solutions to generate
         self.num_solutions = num_solutions
 
+        # LRU cache of successful results, keyed by problem
+        self.plan_cache_size = plan_cache_size
+        self._plan_cache: OrderedDict[tuple[str, int], SolveResult] = OrderedDict()
+        self._plan_cache_lock = threading.Lock()
+
         # Initialize agents
         self.constraint_agent = ConstraintAgent(self.model, self.prompt_manager)
         self.solution_agent = SolutionAgent(self.model, self.prompt_manager)
@@ -70,11 +135,15 @@ class PlanGEN:
             Updated workflow state
         """
         try:
-            constraints = self.constraint_agent.extract_constraints(state["problem"])
+            result = _as_agent_result(
+                self.constraint_agent.extract_constraints(state["problem"]),
+            )
         except Exception as e:
-            return {"error": f"Error extracting constraints: {e!s}"}
-        else:
-            return {"constraints": constraints}
+            result = AgentResult(ok=False, error=str(e))
+
+        if not result.ok:
+            return {"error": f"Error extracting constraints: {result.error}"}
+        return {"constraints": result.value}
 
     def _generate_solutions(self: Self, state: PlanGENState) -> PlanGENState:
         """Generate solutions based on constraints.
@@ -86,15 +155,19 @@ class PlanGEN:
             Updated workflow state
         """
         try:
-            solutions = self.solution_agent.generate_solutions(
-                state["problem"],
-                state["constraints"],
-                num_solutions=self.num_solutions,
+            result = _as_agent_result(
+                self.solution_agent.generate_solutions(
+                    state["problem"],
+                    state["constraints"],
+                    num_solutions=self.num_solutions,
+                ),
             )
         except Exception as e:
-            return {"error": f"Error generating solutions: {e!s}"}
-        else:
-            return {"solutions": solutions}
+            result = AgentResult(ok=False, error=str(e))
+
+        if not result.ok:
+            return {"error": f"Error generating solutions: {result.error}"}
+        return {"solutions": result.value}
 
     def _verify_solutions(self: Self, state: PlanGENState) -> PlanGENState:
         """Verify solutions against constraints.
@@ -106,14 +179,18 @@ class PlanGEN:
             Updated workflow state
         """
         try:
-            verification_results = self.verification_agent.verify_solutions(
-                state["solutions"],
-                state["constraints"],
+            result = _as_agent_result(
+                self.verification_agent.verify_solutions(
+                    state["solutions"],
+                    state["constraints"],
+                ),
             )
         except Exception as e:
-            return {"error": f"Error verifying solutions: {e!s}"}
-        else:
-            return {"verification_results": verification_results}
+            result = AgentResult(ok=False, error=str(e))
+
+        if not result.ok:
+            return {"error": f"Error verifying solutions: {result.error}"}
+        return {"verification_results": result.value}
 
     def _select_solution(self: Self, state: PlanGENState) -> PlanGENState:
         """Select the best solution based on verification results.
@@ -125,14 +202,18 @@ class PlanGEN:
             Updated workflow state
         """
         try:
-            selected = self.selection_agent.select_best_solution(
-                state["solutions"],
-                state["verification_results"],
+            result = _as_agent_result(
+                self.selection_agent.select_best_solution(
+                    state["solutions"],
+                    state["verification_results"],
+                ),
             )
         except Exception as e:
-            return {"error": f"Error selecting solution: {e!s}"}
-        else:
-            return {"selected_solution": selected}
+            result = AgentResult(ok=False, error=str(e))
+
+        if not result.ok:
+            return {"error": f"Error selecting solution: {result.error}"}
+        return {"selected_solution": result.value}
 
     def _should_end(self: Self, state: PlanGENState) -> str:
         """Determine if the workflow should end.
@@ -174,9 +255,71 @@ class PlanGEN:
         # Compile the graph
         return workflow.compile()
 
+    def clear_plan_cache(self: Self) -> None:
+        """Discard all cached results."""
+        with self._plan_cache_lock:
+            self._plan_cache.clear()
+
+    def _get_cached_plan(self: Self, problem: str) -> SolveResult | None:
+        """Look up a cached result for a problem.
+
+        Args:
+            problem: Problem statement
+
+        Returns:
+            A copy of the cached SolveResult, or None if caching is disabled
+            or missed
+        """
+        if self.plan_cache_size <= 0:
+            return None
+        key = (problem, self.num_solutions)
+        with self._plan_cache_lock:
+            result = self._plan_cache.get(key)
+            if result is None:
+                return None
+            self._plan_cache.move_to_end(key)
+        # Callers may modify the result, so never hand out the cached object
+        return copy.deepcopy(result)
+
+    def _cache_plan(self: Self, result: SolveResult) -> None:
+        """Cache a successful result, evicting the least recently used.
+
+        Args:
+            result: Result of solving result.problem
+        """
+        if self.plan_cache_size <= 0 or result.error is not None:
+            return
+        key = (result.problem, self.num_solutions)
+        result = copy.deepcopy(result)
+        with self._plan_cache_lock:
+            self._plan_cache[key] = result
+            self._plan_cache.move_to_end(key)
+            while len(self._plan_cache) > self.plan_cache_size:
+                self._plan_cache.popitem(last=False)
+
     def solve(self: Self, problem: str) -> SolveResult:
         """Solve a problem using the PlanGEN workflow.
 
+        If the plan cache is enabled and this problem was solved successfully
+        before, the cached result is returned without running the workflow.
+
+        Args:
+            problem: Problem statement
+
+        Returns:
+            SolveResult with the solution and intermediate results
+        """
+        cached = self._get_cached_plan(problem)
+        if cached is not None:
+            return cached
+
+        result = self._solve(problem)
+        self._cache_plan(result)
+        return result
+
+    def _solve(self: Self, problem: str) -> SolveResult:
+        """Run the PlanGEN workflow without consulting the plan cache.
+
         Args:
             problem: Problem statement
 
@@ -197,29 +340,15 @@ class PlanGEN:
             # Extract constraints
             constraints_result = self._extract_constraints(state)
             if "error" in constraints_result:
-                return SolveResult(
-                    problem=problem,
-                    constraints=None,
-                    solutions=None,
-                    verification_results=None,
-                    selected_solution=None,
-                    score=None,
-                    metadata={},
-                    error=constraints_result["error"],
-                )
+                return make_solve_result(problem, error=constraints_result["error"])
             state.update(constraints_result)
 
             # Generate solutions
             solutions_result = self._generate_solutions(state)
             if "error" in solutions_result:
-                return SolveResult(
-                    problem=problem,
+                return make_solve_result(
+                    problem,
                     constraints=state.get("constraints"),
-                    solutions=None,
-                    verification_results=None,
-                    selected_solution=None,
-                    score=None,
-                    metadata={},
                     error=solutions_result["error"],
                 )
             state.update(solutions_result)
@@ -227,14 +356,10 @@ class PlanGEN:
             # Verify solutions
             verify_result = self._verify_solutions(state)
             if "error" in verify_result:
-                return SolveResult(
-                    problem=problem,
+                return make_solve_result(
+                    problem,
                     constraints=state.get("constraints"),
                     solutions=state.get("solutions"),
-                    verification_results=None,
-                    selected_solution=None,
-                    score=None,
-                    metadata={},
                     error=verify_result["error"],
                 )
             state.update(verify_result)
@@ -242,14 +367,11 @@ class PlanGEN:
             # Select solution
             select_result = self._select_solution(state)
             if "error" in select_result:
-                return SolveResult(
-                    problem=problem,
+                return make_solve_result(
+                    problem,
                     constraints=state.get("constraints"),
                     solutions=state.get("solutions"),
                     verification_results=state.get("verification_results"),
-                    selected_solution=None,
-                    score=None,
-                    metadata={},
                     error=select_result["error"],
                 )
             state.update(select_result)
@@ -258,33 +380,59 @@ class PlanGEN:
             selected = state.get("selected_solution")
             score = selected.get("score") if selected else None
 
-            return SolveResult(
-                problem=problem,
+            return make_solve_result(
+                problem,
                 constraints=state.get("constraints"),
                 solutions=state.get("solutions"),
                 verification_results=state.get("verification_results"),
                 selected_solution=state.get("selected_solution"),
                 score=score,
-                metadata={},
-                error=None,
             )
         except Exception as e:
-            return SolveResult(
-                problem=problem,
-                constraints=None,
-                solutions=None,
-                verification_results=None,
-                selected_solution=None,
-                score=None,
-                metadata={},
-                error=f"Error in workflow: {e!s}",
-            )
+            return make_solve_result(problem, error=f"Error in workflow: {e!s}")
 
-    def solve_stream(self: Self, problem: str) -> Iterator[dict[str, Any]]:
+    @overload
+    def solve_stream(
+        self: Self,
+        problem: str,
+        copy_data: bool = ...,
+        stream_format: Literal["dict"] = ...,
+    ) -> Generator[dict[str, Any], None, None]: ...
+
+    @overload
+    def solve_stream(
+        self: Self,
+        problem: str,
+        copy_data: bool = ...,
+        *,
+        stream_format: Literal["tuple"],
+    ) -> Generator[StreamUpdate, None, None]: ...
+
+    @overload
+    def solve_stream(
+        self: Self,
+        problem: str,
+        copy_data: bool = ...,
+        stream_format: str = ...,
+    ) -> Generator[dict[str, Any] | StreamUpdate, None, None]: ...
+
+    def solve_stream(
+        self: Self,
+        problem: str,
+        copy_data: bool = True,
+        stream_format: str = "dict",
+    ) -> Generator[dict[str, Any] | StreamUpdate, None, None]:
         """Solve a problem using the PlanGEN workflow with streaming.
 
         Args:
             problem: Problem statement
+            copy_data: Whether each update gets its own copy of the data
+                accumulated so far. If False, every update shares one dict
+                that grows as the workflow advances, so earlier updates
+                reflect later steps; copy it to keep a snapshot.
+            stream_format: "dict" to yield dictionaries, or "tuple" to yield
+                StreamUpdate named tuples with the same fields (error is None
+                unless status is 'error')
 
         Yields:
             Dictionary with step information:
@@ -292,7 +440,34 @@ class PlanGEN:
                 - status: 'in_progress', 'complete', or 'error'
                 - data: Step-specific data (constraints, solutions, etc.)
                 - error: Error message if status is 'error'
+
+            If the plan cache holds a result for this problem, a single
+            'cache_hit' update with status 'complete' and the same data as the
+            final 'select_solution' update is yielded instead.
+
+        Raises:
+            ValueError: If stream_format is not "dict" or "tuple"
         """
+        if stream_format not in _UPDATE_FACTORIES:
+            msg = f"Unsupported stream format: {stream_format}"
+            raise ValueError(msg)
+        make_update = _UPDATE_FACTORIES[stream_format]
+
+        cached = self._get_cached_plan(problem)
+        if cached is not None:
+            yield make_update(
+                "cache_hit",
+                "complete",
+                {
+                    "constraints": cached.constraints,
+                    "solutions": cached.solutions,
+                    "verification_results": cached.verification_results,
+                    "selected_solution": cached.selected_solution,
+                    "score": cached.score,
+                },
+            )
+            return
+
         try:
             # Initialize the state
             state: PlanGENState = {
@@ -303,132 +478,147 @@ class PlanGEN:
                 "selected_solution": None,
                 "error": None,
             }
+            # Data accumulated across steps and reported with each update
+            data: dict[str, Any] = {}
+
+            for step, run in (
+                ("extract_constraints", self._extract_constraints),
+                ("generate_solutions", self._generate_solutions),
+                ("verify_solutions", self._verify_solutions),
+                ("select_solution", self._select_and_score),
+            ):
+                succeeded = yield from self._stage(
+                    step, run, state, data, stream_format, copy_data,
+                )
+                if not succeeded:
+                    return
+
+            self._cache_plan(
+                make_solve_result(
+                    problem,
+                    constraints=state["constraints"],
+                    solutions=state["solutions"],
+                    verification_results=state["verification_results"],
+                    selected_solution=state["selected_solution"],
+                    score=data["score"],
+                ),
+            )
 
-            # Step 1: Extract constraints
-            yield {
-                "step": "extract_constraints",
-                "status": "in_progress",
-                "data": None,
-            }
+        except Exception as e:
+            yield make_update("error", "error", None, f"Error in workflow: {e!s}")
 
-            constraints_result = self._extract_constraints(state)
-            if "error" in constraints_result:
-                yield {
-                    "step": "extract_constraints",
-                    "status": "error",
-                    "data": None,
-                    "error": constraints_result["error"],
-                }
-                return
+    def _stage(
+        self: Self,
+        step: str,
+        run: Callable[[PlanGENState], Mapping[str, Any]],
+        state: PlanGENState,
+        data: dict[str, Any],
+        stream_format: str,
+        copy_data: bool,
+    ) -> Generator[dict[str, Any] | StreamUpdate, None, bool]:
+        """Run one workflow step, yielding its streaming updates.
 
-            state.update(constraints_result)
-            yield {
-                "step": "extract_constraints",
-                "status": "complete",
-                "data": {"constraints": state["constraints"]},
-            }
+        Args:
+            step: Name of the step
+            run: Step function returning the state update or an error
+            state: Workflow state, updated in place on success
+            data: Data reported so far, updated in place on success
+            stream_format: Format of the updates, as for solve_stream()
+            copy_data: Whether updates get a copy of data, as for solve_stream()
 
-            # Step 2: Generate solutions
-            yield {
-                "step": "generate_solutions",
-                "status": "in_progress",
-                "data": None,
-            }
+        Yields:
+            The step's 'in_progress' update, then its 'complete' or 'error'
+            update
 
-            solutions_result = self._generate_solutions(state)
-            if "error" in solutions_result:
-                yield {
-                    "step": "generate_solutions",
-                    "status": "error",
-                    "data": {"constraints": state["constraints"]},
-                    "error": solutions_result["error"],
-                }
-                return
+        Returns:
+            True if the step succeeded
+        """
+        make_update = _UPDATE_FACTORIES[stream_format]
+        if stream_format == "tuple":
+            yield _IN_PROGRESS_TUPLES[step]
+        else:
+            yield make_update(step, "in_progress", None)
+
+        result = run(state)
+        if "error" in result:
+            # Error updates report the data from earlier steps, if any
+            yield make_update(
+                step,
+                "error",
+                (dict(data) if copy_data else data) if data else None,
+                result["error"],
+            )
+            return False
 
-            state.update(solutions_result)
-            yield {
-                "step": "generate_solutions",
-                "status": "complete",
-                "data": {
-                    "constraints": state["constraints"],
-                    "solutions": state["solutions"],
-                },
-            }
+        # The selection step's result also carries its score, which only the
+        # updates report; no step reads it back from the state
+        state.update(cast(PlanGENState, result))
+        data.update(result)
+        yield make_update(step, "complete", dict(data) if copy_data else data)
+        return True
 
-            # Step 3: Verify solutions
-            yield {
-                "step": "verify_solutions",
-                "status": "in_progress",
-                "data": None,
-            }
+    def _select_and_score(self: Self, state: PlanGENState) -> Mapping[str, Any]:
+        """Select the best solution and report its score alongside it.
 
-            verify_result = self._verify_solutions(state)
-            if "error" in verify_result:
-                yield {
-                    "step": "verify_solutions",
-                    "status": "error",
-                    "data": {
-                        "constraints": state["constraints"],
-                        "solutions": state["solutions"],
-                    },
-                    "error": verify_result["error"],
-                }
-                return
+        Args:
+            state: Current workflow state
 
-            state.update(verify_result)
-            yield {
-                "step": "verify_solutions",
-                "status": "complete",
-                "data": {
-                    "constraints": state["constraints"],
-                    "solutions": state["solutions"],
-                    "verification_results": state["verification_results"],
-                },
-            }
+        Returns:
+            Selection result with the selected solution's score, or an error
+        """
+        result = self._select_solution(state)
+        if "error" in result:
+            return result
 
-            # Step 4: Select solution
-            yield {
-                "step": "select_solution",
-                "status": "in_progress",
-                "data": None,
-            }
+        # Extract score from selected solution if available
+        selected = result["selected_solution"]
+        return {**result, "score": selected.get("score") if selected else None}
 
-            select_result = self._select_solution(state)
-            if "error" in select_result:
-                yield {
-                    "step": "select_solution",
-                    "status": "error",
-                    "data": {
-                        "constraints": state["constraints"],
-                        "solutions": state["solutions"],
-                        "verification_results": state["verification_results"],
-                    },
-                    "error": select_result["error"],
-                }
-                return
+    async def solve_stream_async(
+        self: Self, problem: str,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Solve a problem using the PlanGEN workflow with async streaming.
 
-            state.update(select_result)
+        The blocking workflow runs on a worker thread and hands each update to
+        the event loop through an asyncio.Queue, so other coroutines (for
+        example, other problems being solved with asyncio.gather) keep running
+        while model calls are in flight.
 
-            # Extract score from selected solution if available
-            selected = state.get("selected_solution")
-            score = selected.get("score") if selected else None
+        If the consumer stops iterating early (breaks, is cancelled, or closes
+        the generator), the worker finishes the step in progress and runs no
+        further steps.
 
-            yield {
-                "step": "select_solution",
-                "status": "complete",
-                "data": {
-                    "constraints": state["constraints"],
-                    "solutions": state["solutions"],
-                    "verification_results": state["verification_results"],
-                    "selected_solution": state["selected_solution"],
-                    "score": score,
-                },
-            }
+        Args:
+            problem: Problem statement
 
-        except Exception as e:
-            yield {
-                "step": "error",
-                "status": "error",
-                "data": None,
-                "error": f"Error in workflow: {e!s}",
-            }
+        Yields:
+            The same updates as solve_stream(), in the same order
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[Any] = asyncio.Queue()
+        # Set when the consumer stops early, so the worker skips later steps
+        stop = threading.Event()
+
+        def produce() -> None:
+            updates = self.solve_stream(problem)
+            try:
+                for update in updates:
+                    if stop.is_set():
+                        break
+                    loop.call_soon_threadsafe(queue.put_nowait, update)
+            finally:
+                updates.close()
+                loop.call_soon_threadsafe(queue.put_nowait, _STREAM_END)
+
+        producer = loop.run_in_executor(None, produce)
+        try:
+            while True:
+                update = await queue.get()
+                if update is _STREAM_END:
+                    break
+                yield update
+
+            # Surface any exception raised outside solve_stream's own handling
+            await producer
+        finally:
+            stop.set()
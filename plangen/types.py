@@ -1,15 +1,51 @@
 """Type definitions for the PlanGEN framework.
 
-This module defines TypedDict classes for structured return values and data structures
-used throughout the framework. These types improve type safety and IDE support.
+This module defines the result classes for structured return values and data
+structures used throughout the framework. These types improve type safety and
+IDE support.
+
+The result classes are slotted dataclasses. They are also read-only mappings of
+field names to values (``result["score"]``, ``result.get("score")``,
+``"score" in result``, iteration, ``len(result)``, ``dict(result)``) and compare
+equal to the equivalent dict, for code written against the earlier TypedDict
+definitions. They are not dicts, though: pass
+``result.to_dict()`` to ``json.dump()`` and other code that requires one.
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, TypedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import (Any, ClassVar, Dict, Iterator, List, Mapping, NamedTuple,
+                    Optional)
 
 
-class VerificationResult(TypedDict):
+class _ResultMapping(Mapping[str, Any]):
+    """Read-only mapping access to dataclass fields by name."""
+
+    __slots__ = ()
+
+    # Set on each subclass by @dataclass
+    __dataclass_fields__: ClassVar[Dict[str, Any]]
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__dataclass_fields__)
+
+    def __len__(self) -> int:
+        return len(self.__dataclass_fields__)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a shallow dict copy of the fields, e.g. for json.dump()."""
+        return dict(self)
+
+
+@dataclass(eq=False)
+class VerificationResult(_ResultMapping):
     """Result from verifying a solution.
 
     Attributes:
@@ -19,13 +55,16 @@ class VerificationResult(TypedDict):
         feedback: Optional detailed feedback
     """
 
+    __slots__ = ("is_valid", "score", "reason", "feedback")
+
     is_valid: bool
     score: float
     reason: str
     feedback: Optional[str]
 
 
-class SolveResult(TypedDict):
+@dataclass(eq=False)
+class SolveResult(_ResultMapping):
     """Result from solving a problem with PlanGEN.
 
     Attributes:
@@ -39,6 +78,17 @@ class SolveResult(TypedDict):
         error: Error message if the solving process failed (if any)
     """
 
+    __slots__ = (
+        "problem",
+        "constraints",
+        "solutions",
+        "verification_results",
+        "selected_solution",
+        "score",
+        "metadata",
+        "error",
+    )
+
     problem: str
     constraints: Optional[str]
     solutions: Optional[List[str]]
@@ -49,7 +99,40 @@ class SolveResult(TypedDict):
     error: Optional[str]
 
 
-class AlgorithmResult(TypedDict):
+# Values make_solve_result() uses for fields it is not given. The slotted
+# dataclasses cannot carry field defaults of their own.
+EMPTY_SOLVE_RESULT: Mapping[str, Any] = MappingProxyType(
+    {
+        "constraints": None,
+        "solutions": None,
+        "verification_results": None,
+        "selected_solution": None,
+        "score": None,
+        "error": None,
+    },
+)
+
+
+def make_solve_result(problem: str, **values: Any) -> SolveResult:
+    """Create a SolveResult, defaulting omitted fields.
+
+    Fields not given take their value from EMPTY_SOLVE_RESULT; metadata
+    defaults to a new empty dict.
+
+    Args:
+        problem: The original problem statement
+        **values: Values for any other SolveResult fields
+
+    Returns:
+        The new SolveResult
+    """
+    if "metadata" not in values:
+        values["metadata"] = {}
+    return SolveResult(problem=problem, **{**EMPTY_SOLVE_RESULT, **values})
+
+
+@dataclass(eq=False)
+class AlgorithmResult(_ResultMapping):
     """Result from running an algorithm.
 
     Attributes:
@@ -58,12 +141,15 @@ class AlgorithmResult(TypedDict):
         metadata: Additional metadata from the algorithm execution
     """
 
+    __slots__ = ("best_plan", "score", "metadata")
+
     best_plan: str
     score: float
-    metadata: dict[str, Any]
+    metadata: Dict[str, Any]
 
 
-class PlanResult(TypedDict):
+@dataclass(eq=False)
+class PlanResult(_ResultMapping):
     """Result from the simplified solve API.
 
     Attributes:
@@ -73,7 +159,42 @@ class PlanResult(TypedDict):
         metadata: Additional metadata from the solving process
     """
 
+    __slots__ = ("problem", "selected_solution", "score", "metadata")
+
     problem: str
     selected_solution: str
     score: float
-    metadata: dict[str, Any]
+    metadata: Dict[str, Any]
+
+
+class AgentResult(NamedTuple):
+    """Outcome of an agent call, for agents that report failure without raising.
+
+    PlanGEN accepts an AgentResult from any agent method it calls in place of
+    the plain return value.
+
+    Attributes:
+        ok: Whether the call succeeded
+        value: The call's result if ok, otherwise None
+        error: Error message if not ok, otherwise None
+    """
+
+    ok: bool
+    value: Any = None
+    error: Optional[str] = None
+
+
+class StreamUpdate(NamedTuple):
+    """Update from PlanGEN.solve_stream() with stream_format="tuple".
+
+    Attributes:
+        step: Name of the current step
+        status: 'in_progress', 'complete', or 'error'
+        data: Step-specific data (constraints, solutions, etc.)
+        error: Error message if status is 'error', otherwise None
+    """
+
+    step: str
+    status: str
+    data: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
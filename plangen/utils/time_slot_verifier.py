@@ -6,6 +6,10 @@ from dataclasses import dataclass
 from typing_extensions import Self
 
 
+# Time slot like "9:30-10:00" or "9:30 to 10:00"
+_TIME_SLOT_RE = re.compile(r"(\d{1,2}):(\d{2})(?:\s*(?:-|to)\s*)(\d{1,2}):(\d{2})")
+
+
 @dataclass
 class TimeSlot:
     """Represents a time slot with start and end times."""
@@ -23,8 +27,7 @@ class TimeSlot:
         Returns:
             TimeSlot object or None if parsing fails
         """
-        pattern = r"(\d{1,2}):(\d{2})(?:\s*(?:-|to)\s*)(\d{1,2}):(\d{2})"
-        match = re.match(pattern, time_str)
+        match = _TIME_SLOT_RE.match(time_str)
 
         if not match:
             return None
@@ -12,6 +12,19 @@ from plangen.verification.base_verifier import BaseVerifier
 MIN_EQUATION_TERMS = 2
 MIN_STEP_LINES = 2
 
+# Precompiled patterns
+_EXPRESSION_RE = re.compile(r"\d+\s*[\+\-\*/\=]\s*\d+")
+_STATED_ANSWER_RE = re.compile(
+    r"(?:answer|result|solution)(?:\s*is|\s*=)?\s*(-?\d+\.?\d*)",
+)
+_EQUALS_ANSWER_RE = re.compile(r"=\s*(-?\d+\.?\d*)")
+_TRAILING_NUMBER_RE = re.compile(r"(-?\d+\.?\d*)\s*$")
+_CALCULATION_RE = re.compile(r"\d+\s*[\+\-\*/]\s*\d+\s*=\s*\d+")
+_RANGE_RE = re.compile(r"between\s+(-?\d+\.?\d*)\s+and\s+(-?\d+\.?\d*)")
+_PRECISION_RE = re.compile(
+    r"(?:round|precision|decimal places|significant figures).*?(\d+)",
+)
+
 class MathVerifier(BaseVerifier):
     """Math-specific implementation of the verifier interface.
 
@@ -59,7 +72,7 @@ class MathVerifier(BaseVerifier):
                 return True
 
         # Check for numerical patterns
-        return bool(re.search(r"\d+\s*[\+\-\*/\=]\s*\d+", problem_statement))
+        return bool(_EXPRESSION_RE.search(problem_statement))
 
     def verify_solution(
         self: Self, problem_statement: str, solution: str, _constraints: list[str],
@@ -147,13 +160,13 @@ class MathVerifier(BaseVerifier):
         """
         # Look for patterns like "answer is 42" or "= 42"
         patterns = [
-            r"(?:answer|result|solution)(?:\s*is|\s*=)?\s*(-?\d+\.?\d*)",
-            r"=\s*(-?\d+\.?\d*)",
-            r"(-?\d+\.?\d*)\s*$",  # Answer at the end of the solution
+            _STATED_ANSWER_RE,
+            _EQUALS_ANSWER_RE,
+            _TRAILING_NUMBER_RE,  # Answer at the end of the solution
         ]
 
         for pattern in patterns:
-            match = re.search(pattern, solution.lower())
+            match = pattern.search(solution.lower())
             if match:
                 try:
                     return float(match.group(1))
@@ -172,13 +185,10 @@ class MathVerifier(BaseVerifier):
             Expected answer if found, None otherwise
         """
         # Some math problems might include the expected answer
-        patterns = [
-            r"(?:answer|result|solution)(?:\s*is|\s*=)?\s*(-?\d+\.?\d*)",
-            r"=\s*(-?\d+\.?\d*)",
-        ]
+        patterns = [_STATED_ANSWER_RE, _EQUALS_ANSWER_RE]
 
         for pattern in patterns:
-            match = re.search(pattern, problem_statement.lower())
+            match = pattern.search(problem_statement.lower())
             if match:
                 try:
                     return float(match.group(1))
@@ -200,8 +210,7 @@ class MathVerifier(BaseVerifier):
         # In a real system, this would parse and validate each calculation step
 
         # Check for common calculation patterns
-        calculation_pattern = r"\d+\s*[\+\-\*/]\s*\d+\s*=\s*\d+"
-        has_calculations = bool(re.search(calculation_pattern, solution))
+        has_calculations = bool(_CALCULATION_RE.search(solution))
 
         # Check for step-by-step working
         has_steps = len(solution.split("\n")) > MIN_STEP_LINES
@@ -241,17 +250,13 @@ class MathVerifier(BaseVerifier):
         constraints = []
 
         # Look for range constraints
-        range_pattern = r"between\s+(-?\d+\.?\d*)\s+and\s+(-?\d+\.?\d*)"
-        match = re.search(range_pattern, problem_statement.lower())
+        match = _RANGE_RE.search(problem_statement.lower())
         if match:
             lower, upper = match.groups()
             constraints.append(f"The answer must be between {lower} and {upper}.")
 
         # Look for precision constraints
-        precision_pattern = (
-            r"(?:round|precision|decimal places|significant figures).*?(\d+)"
-        )
-        match = re.search(precision_pattern, problem_statement.lower())
+        match = _PRECISION_RE.search(problem_statement.lower())
         if match:
             precision = match.group(1)
             constraints.append(
@@ -2,20 +2,87 @@
 from __future__ import annotations
 
 import json
+import math
 import time
+from enum import Enum
 from pathlib import Path
 from typing import Any
 from typing_extensions import Self
 
 import matplotlib.pyplot as plt
 import networkx as nx
+import numpy as np
 
 from .observers import PlanObserver
 
+try:
+    import orjson
+except ImportError:  # Optional; save_graph_data falls back to the json module
+    orjson = None
+
 
 # Constants
 DEFAULT_SCORE_THRESHOLD = 0.5
 
+# rcParams applied while rendering; edges are straight lines, so the coarsest
+# path simplification loses no visible detail
+_RENDER_RC_PARAMS = {"path.simplify": True, "path.simplify_threshold": 1.0}
+
+
+def _finite(value: Any) -> Any:
+    """Replace non-finite floats with None, as orjson writes them.
+
+    Args:
+        value: Float, or dict/list/tuple nesting them
+
+    Returns:
+        The value with NaN and infinities replaced by None
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
+    return value
+
+
+def _json_default(value: Any) -> Any:
+    """Convert a value the JSON encoders cannot handle natively.
+
+    Used as the default hook for both orjson and the json module, so
+    save_graph_data writes the same document with either.
+
+    Args:
+        value: Value to convert
+
+    Returns:
+        Python scalars or lists for numpy values, the value of enum members,
+        otherwise str(value)
+    """
+    if isinstance(value, (np.generic, np.ndarray)):
+        return _finite(value.tolist())
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+def _score_colors(scores: np.ndarray) -> list[tuple[float, float, float]]:
+    """Map scores to a red-yellow-green ramp.
+
+    Args:
+        scores: Array of scores, clipped to [0, 1]
+
+    Returns:
+        One RGB tuple per score
+    """
+    norm = np.clip(scores, 0.0, 1.0)
+    low = norm < DEFAULT_SCORE_THRESHOLD
+    colors = np.zeros((len(norm), 3))
+    colors[:, 0] = np.where(low, 1.0, (1 - norm) * 2)
+    colors[:, 1] = np.where(low, norm * 2, 1.0)
+    return [tuple(row) for row in colors.tolist()]
+
 
 class GraphRenderer(PlanObserver):
     """Observer that renders plan exploration graphs.
@@ -83,23 +150,36 @@ class GraphRenderer(PlanObserver):
             plan_data: Dictionary containing tree of thought update data
         """
         if "new_nodes" in plan_data:
+            timestamp = time.time()
+            nodes = []
+            edges = []
+            batch_ids = set()
             for node in plan_data["new_nodes"]:
-                node_id = node.get("id", f"node_{time.time()}_{id(node)}")
+                node_id = node.get("id", f"node_{timestamp}_{id(node)}")
                 parent_id = node.get("parent_id")
 
-                # Add node with attributes
-                self.graph.add_node(
-                    node_id,
-                    steps=node.get("steps", []),
-                    score=node.get("score", 0),
-                    depth=node.get("depth", 0),
-                    complete=node.get("complete", False),
-                    timestamp=time.time(),
+                # Collect node with attributes
+                nodes.append(
+                    (
+                        node_id,
+                        {
+                            "steps": node.get("steps", []),
+                            "score": node.get("score", 0),
+                            "depth": node.get("depth", 0),
+                            "complete": node.get("complete", False),
+                            "timestamp": timestamp,
+                        },
+                    ),
                 )
+                batch_ids.add(node_id)
 
-                # Add edge from parent if it exists
-                if parent_id and parent_id in self.graph:
-                    self.graph.add_edge(parent_id, node_id)
+                # Collect edge from parent if it exists, possibly in this batch
+                if parent_id and (parent_id in batch_ids or parent_id in self.graph):
+                    edges.append((parent_id, node_id))
+
+            # Insert the whole expansion at once
+            self.graph.add_nodes_from(nodes)
+            self.graph.add_edges_from(edges)
 
     def _update_rebase_graph(self: Self, plan_data: dict[str, Any]) -> None:
         """Update graph for REBASE algorithm.
@@ -366,24 +446,47 @@ class GraphRenderer(PlanObserver):
         self: Self, node_data: dict[str, Any],
     ) -> tuple[str, str | tuple[float, float, float]]:
         """Create label and color for TreeOfThought nodes."""
+        label = self._create_tree_of_thought_label(node_data)
+        if node_data.get("complete", False):
+            return label, "green"
+        return label, _score_colors(np.array([node_data.get("score", 0)]))[0]
+
+    def _create_tree_of_thought_labels_and_colors(
+        self: Self,
+    ) -> tuple[dict[Any, str], list[str | tuple[float, float, float]]]:
+        """Create labels and colors for every TreeOfThought node at once.
+
+        Scores are gathered into one array so the color ramp is computed for
+        all nodes in a single vectorized pass.
+
+        Returns:
+            Tuple of (labels keyed by node, colors in node order)
+        """
+        nodes = list(self.graph.nodes(data=True))
+        scores = np.fromiter(
+            (node_data.get("score", 0) for _, node_data in nodes),
+            dtype=float,
+            count=len(nodes),
+        )
+
+        node_labels = {}
+        node_colors: list[str | tuple[float, float, float]] = []
+        for (node, node_data), color in zip(nodes, _score_colors(scores)):
+            node_labels[node] = self._create_tree_of_thought_label(node_data)
+            node_colors.append("green" if node_data.get("complete", False) else color)
+        return node_labels, node_colors
+
+    @staticmethod
+    def _create_tree_of_thought_label(node_data: dict[str, Any]) -> str:
+        """Create the label for a TreeOfThought node."""
         score = node_data.get("score", 0)
         depth = node_data.get("depth", 0)
-        complete = node_data.get("complete", False)
         steps_str = (
             str(node_data.get("steps", []))[:30] + "..."
             if "steps" in node_data
             else ""
         )
-        label = f"D{depth}\nS:{score:.2f}\n{steps_str}"
-        if complete:
-            return label, "green"
-        score_norm = max(0, min(1, score))
-        color = (
-            (1.0, score_norm * 2, 0)
-            if score_norm < DEFAULT_SCORE_THRESHOLD
-            else ((1 - score_norm) * 2, 1.0, 0)
-        )
-        return label, color
+        return f"D{depth}\nS:{score:.2f}\n{steps_str}"
 
     def _create_rebase_label_and_color(
         self: Self, node: str, node_data: dict[str, Any],
@@ -456,63 +559,80 @@ class GraphRenderer(PlanObserver):
         if len(self.graph) == 0:
             return
 
-        # Clear any existing figure
-        plt.figure(figsize=(12, 8))
+        # Simplify edge paths as aggressively as matplotlib allows while
+        # drawing, without changing the caller's global rcParams
+        with plt.rc_context(_RENDER_RC_PARAMS):
+            # Clear any existing figure
+            plt.figure(figsize=(12, 8))
 
-        # Compute layout
-        pos = self._compute_layout()
+            # Compute layout
+            pos = self._compute_layout()
 
-        # Create node labels and colors
-        node_labels = {}
-        node_colors = []
-        for node in self.graph.nodes:
-            node_data = self.graph.nodes[node]
-            label, color = self._create_node_label_and_color(node, node_data)
-            node_labels[node] = label
-            node_colors.append(color)
-
-        # Draw the graph
-        nx.draw(
-            self.graph,
-            pos=pos,
-            with_labels=True,
-            labels=node_labels,
-            node_color=node_colors,
-            node_size=2000,
-            font_size=8,
-            font_weight="bold",
-            arrows=True,
-        )
-
-        # Add title with algorithm type and timestamp
-        plt.title(
-            f"{self.algorithm_type or 'Unknown'} Plan Exploration - {time.strftime('%Y-%m-%d %H:%M:%S')}",
-        )
-
-        # Save the figure if requested
-        if save:
-            if not filename:
-                timestamp = time.strftime("%Y%m%d%H%M%S")
-                filename = (
-                    f"{self.algorithm_type or 'plan'}_{timestamp}.{self.render_format}"
+            # Create node labels and colors
+            if self.algorithm_type == "TreeOfThought":
+                node_labels, node_colors = (
+                    self._create_tree_of_thought_labels_and_colors()
                 )
+            else:
+                node_labels = {}
+                node_colors = []
+                for node in self.graph.nodes:
+                    node_data = self.graph.nodes[node]
+                    label, color = self._create_node_label_and_color(node, node_data)
+                    node_labels[node] = label
+                    node_colors.append(color)
+
+            # Draw the graph
+            nx.draw(
+                self.graph,
+                pos=pos,
+                with_labels=True,
+                labels=node_labels,
+                node_color=node_colors,
+                node_size=2000,
+                font_size=8,
+                font_weight="bold",
+                arrows=True,
+            )
 
-            filepath = Path(self.output_dir) / filename
-            plt.savefig(
-                str(filepath), format=self.render_format, dpi=300, bbox_inches="tight",
+            # Add title with algorithm type and timestamp
+            rendered_at = time.strftime("%Y-%m-%d %H:%M:%S")
+            plt.title(
+                f"{self.algorithm_type or 'Unknown'} Plan Exploration - {rendered_at}",
             )
 
+            # Save the figure if requested
+            if save:
+                if not filename:
+                    timestamp = time.strftime("%Y%m%d%H%M%S")
+                    algorithm = self.algorithm_type or "plan"
+                    filename = f"{algorithm}_{timestamp}.{self.render_format}"
+
+                filepath = Path(self.output_dir) / filename
+                plt.savefig(
+                    str(filepath),
+                    format=self.render_format,
+                    dpi=300,
+                    bbox_inches="tight",
+                )
+
         # Display the figure if requested
         if display:
             plt.show()
         else:
             plt.close()
 
-    def save_graph_data(self: Self, filename: str | None = None) -> None:
+    def save_graph_data(self: Self, filename: str | None = None) -> Path:
         """Save the current graph data as JSON.
 
+        Uses orjson when it is installed and the standard json module
+        otherwise; both produce the same document.
+
         Args:
             filename: Optional custom filename for saving
+
+        Returns:
+            Path to the saved file
         """
         if not filename:
             timestamp = time.strftime("%Y%m%d%H%M%S")
@@ -520,24 +640,36 @@ class GraphRenderer(PlanObserver):
 
         filepath = Path(self.output_dir) / filename
 
-        # Convert graph to serializable format
-        graph_data = {"nodes": [], "edges": []}
-
-        for node in self.graph.nodes:
-            node_data = dict(self.graph.nodes[node])
-            # Convert non-serializable values to strings
-            for key, value in node_data.items():
-                if not isinstance(
-                    value, (str, int, float, bool, list, dict, type(None)),
-                ):
-                    node_data[key] = str(value)
-
-            graph_data["nodes"].append({"id": node, "data": node_data})
-
-        for source, target in self.graph.edges:
-            graph_data["edges"].append({"source": source, "target": target})
-
-        with filepath.open("w") as f:
-            json.dump(graph_data, f, indent=2)
+        # Convert graph to serializable format; numpy values are written as
+        # numbers or lists, NaN and infinities as null, and anything else the
+        # encoder cannot handle natively as a string
+        graph_data = {
+            "nodes": [
+                {"id": node, "data": data}
+                for node, data in self.graph.nodes(data=True)
+            ],
+            "edges": [
+                {"source": source, "target": target}
+                for source, target in self.graph.edges
+            ],
+        }
+
+        if orjson is not None:
+            # Route datetimes and dataclasses through _json_default, as the
+            # json module does; orjson already writes NaN as null
+            options = (
+                orjson.OPT_INDENT_2
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_DATACLASS
+            )
+            filepath.write_bytes(
+                orjson.dumps(graph_data, default=_json_default, option=options),
+            )
+        else:
+            with filepath.open("w") as f:
+                json.dump(
+                    _finite(graph_data), f, indent=2, default=_json_default,
+                )
 
         return filepath
@@ -0,0 +1,20 @@
+"""
+Helpers shared by the PlanGEN tests.
+"""
+
+from collections import defaultdict
+
+
+def bucket_updates(updates):
+    """Group streaming updates by step in a single pass.
+
+    Args:
+        updates: Iterable of updates from solve_stream()
+
+    Returns:
+        defaultdict(list): Updates keyed by their "step", in stream order.
+    """
+    by_step = defaultdict(list)
+    for update in updates:
+        by_step[update["step"]].append(update)
+    return by_step
@@ -5,10 +5,32 @@ This module provides common fixtures that can be reused across all test files,
 reducing code duplication and ensuring consistency in test setup.
 """
 
-import pytest
-from unittest.mock import MagicMock
-from plangen.models import BaseModelInterface
-from plangen.prompts import PromptManager
+import matplotlib
+
+# Render with the non-interactive Agg backend so no GUI toolkit is probed;
+# this must run before anything imports matplotlib.pyplot
+matplotlib.use("Agg", force=True)
+
+import pytest  # noqa: E402
+from unittest.mock import MagicMock  # noqa: E402
+from plangen.agents import ConstraintAgent, VerificationAgent  # noqa: E402
+from plangen.models import BaseModelInterface  # noqa: E402
+from plangen.prompts import PromptManager  # noqa: E402
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _check_agent_api():
+    """Assert once per session that the agent methods PlanGEN relies on exist.
+
+    Regression guard for issues #25 (ConstraintAgent.extract_constraints) and
+    #26 (VerificationAgent.verify_solutions).
+    """
+    assert callable(
+        getattr(ConstraintAgent, "extract_constraints", None)
+    ), "ConstraintAgent must have a callable extract_constraints method"
+    assert callable(
+        getattr(VerificationAgent, "verify_solutions", None)
+    ), "VerificationAgent must have a callable verify_solutions method"
 
 
 @pytest.fixture
@@ -13,6 +13,7 @@ from plangen.agents import (
     SolutionAgent,
     VerificationAgent,
 )
+from plangen.prompts import PromptManager
 
 
 class TestConstraintAgent:
@@ -80,7 +81,9 @@ class TestVerificationAgent:
         mock_model = MagicMock()
         mock_prompt_manager = MagicMock()
 
-        mock_model.generate.return_value = "Verification result"
+        mock_model.generate.return_value = (
+            "### Solution 1\nVerification 1\n\n### Solution 2\nVerification 2"
+        )
         mock_prompt_manager.get_system_message.return_value = "System message"
         mock_prompt_manager.get_prompt.return_value = "Prompt"
 
@@ -91,10 +94,149 @@ class TestVerificationAgent:
         )
 
         # Verify
-        assert results == ["Verification result", "Verification result"]
-        assert mock_model.generate.call_count == 2
+        assert results == ["Verification 1", "Verification 2"]
+        assert mock_model.generate.call_count == 1
         mock_prompt_manager.get_system_message.assert_called_with("verification")
-        assert mock_prompt_manager.get_prompt.call_count == 2
+        mock_prompt_manager.get_prompt.assert_called_once_with(
+            "solution_verification_batch",
+            solutions=["Solution 1", "Solution 2"],
+            constraints="Test constraints",
+        )
+
+    @pytest.mark.parametrize(
+        "header",
+        [
+            "### Solution {n}",
+            "Solution {n}:",
+            "**Solution {n}**",
+            "## **Solution {n}**",
+            "### Solution {n}: Verification",
+            "Solution {n} verification:",
+            "__Solution {n}:__",
+        ],
+    )
+    def test_split_batch_response_header_formats(self, header):
+        """Test that common section header formats split the batched response."""
+        response = "\n".join(
+            [
+                "Here are the verifications.",
+                header.format(n=1),
+                "Solution 1 meets all constraints.",
+                "",
+                header.format(n=2),
+                "Verification 2",
+            ]
+        )
+
+        assert VerificationAgent._split_batch_response(response, 2) == [
+            "Solution 1 meets all constraints.",
+            "Verification 2",
+        ]
+
+    def test_split_batch_response_rejects_missing_sections(self):
+        """Test that responses without one header per solution are not split."""
+        assert VerificationAgent._split_batch_response("Solution 1 is fine.", 1) is None
+        assert (
+            VerificationAgent._split_batch_response("### Solution 2\nOK", 2) is None
+        )
+
+    def test_verify_solutions_falls_back_to_individual_prompts(self):
+        """Test that an unparseable batched response falls back to per-solution calls."""
+        # Setup mocks
+        mock_model = MagicMock()
+        mock_prompt_manager = MagicMock()
+
+        # Per-solution calls run concurrently, so answer by prompt, not call order
+        responses = {
+            "Batch prompt": "Both solutions look fine",  # No section headers
+            "Verify Solution 1": "Verification 1",
+            "Verify Solution 2": "Verification 2",
+        }
+        mock_model.generate.side_effect = lambda prompt, **kwargs: responses[prompt]
+        mock_prompt_manager.get_system_message.return_value = "System message"
+        mock_prompt_manager.get_prompt.side_effect = (
+            lambda name, **kwargs: "Batch prompt"
+            if name == "solution_verification_batch"
+            else f"Verify {kwargs['solution']}"
+        )
+
+        # Create agent and test
+        agent = VerificationAgent(mock_model, mock_prompt_manager)
+        results = agent.verify_solutions(
+            ["Solution 1", "Solution 2"], "Test constraints"
+        )
+
+        # Verify
+        assert results == ["Verification 1", "Verification 2"]
+        assert mock_model.generate.call_count == 3
+        mock_prompt_manager.get_prompt.assert_any_call(
+            "solution_verification",
+            solution="Solution 2",
+            constraints="Test constraints",
+        )
+
+    def test_verify_solutions_respects_max_parallel_verifications(self):
+        """Test that the fallback thread pool is capped by the constructor kwarg."""
+        # Setup mocks
+        mock_model = MagicMock()
+        mock_prompt_manager = MagicMock()
+        mock_model.generate.return_value = "No section headers"
+        mock_prompt_manager.get_system_message.return_value = "System message"
+        mock_prompt_manager.get_prompt.return_value = "Prompt"
+
+        # Create agent and test
+        agent = VerificationAgent(
+            mock_model, mock_prompt_manager, max_parallel_verifications=2
+        )
+        with patch(
+            "plangen.agents.verification_agent.ThreadPoolExecutor"
+        ) as mock_executor_class:
+            mock_executor = mock_executor_class.return_value.__enter__.return_value
+            mock_executor.map.return_value = iter(["V1", "V2", "V3"])
+            results = agent.verify_solutions(["S1", "S2", "S3"], "Test constraints")
+
+        # Verify
+        assert results == ["V1", "V2", "V3"]
+        mock_executor_class.assert_called_once_with(max_workers=2)
+
+        with pytest.raises(ValueError, match="max_parallel_verifications"):
+            VerificationAgent(
+                mock_model, mock_prompt_manager, max_parallel_verifications=0
+            )
+
+    def test_verify_solutions_honors_custom_verification_prompt(self):
+        """Test that a customized per-solution prompt disables batching."""
+        # Setup mocks
+        mock_model = MagicMock()
+        mock_model.generate.return_value = "Verification"
+        prompt_manager = PromptManager()
+        prompt_manager.update_prompt("solution_verification", "Check {{ solution }}")
+
+        # Create agent and test
+        agent = VerificationAgent(mock_model, prompt_manager)
+        results = agent.verify_solutions(["S1", "S2"], "Test constraints")
+
+        # Verify
+        assert results == ["Verification", "Verification"]
+        prompts = sorted(call.args[0] for call in mock_model.generate.call_args_list)
+        assert prompts == ["Check S1", "Check S2"]
+
+    def test_verify_solutions_without_batch_template(self, tmp_path):
+        """Test that template directories lacking the batch prompt still work."""
+        # Setup a templates directory without solution_verification_batch.j2
+        (tmp_path / "system_verification.j2").write_text("System")
+        (tmp_path / "solution_verification.j2").write_text("Check {{ solution }}")
+        mock_model = MagicMock()
+        mock_model.generate.return_value = "Verification"
+
+        # Create agent and test
+        agent = VerificationAgent(mock_model, PromptManager(str(tmp_path)))
+        results = agent.verify_solutions(["S1", "S2"], "Test constraints")
+
+        # Verify
+        assert results == ["Verification", "Verification"]
+        assert mock_model.generate.call_count == 2
+        mock_model.generate.assert_any_call("Check S2", system_message="System")
 
     def test_verify_solutions_method_exists_regression_issue_26(self):
         """Regression test for issue #26: verify_solutions method must exist.
@@ -2,114 +2,107 @@
 Tests for the ConstraintAgent class
 """
 
-import unittest
-from unittest.mock import MagicMock, patch
+import textwrap
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
 
 from plangen.agents.constraint_agent import ConstraintAgent
 from plangen.models import BaseModelInterface
 from plangen.prompts import PromptManager
 
-
-class TestConstraintAgent(unittest.TestCase):
+_PROBLEM = textwrap.dedent(
+    """
+    Schedule a 30-minute meeting for Alexander, Elizabeth, and Walter on Monday between 9:00 and 17:00.
+    """
+).strip()
+
+_RESPONSE_NUMBERED = textwrap.dedent(
+    """
+    1. Meeting duration must be 30 minutes
+    2. Meeting must be on Monday
+    3. Meeting must be between 9:00 and 17:00
+    4. All participants must be available
+    """
+).strip()
+
+_RESPONSE_MIXED = textwrap.dedent(
+    """
+    1) Meeting duration must be 30 minutes
+    - Meeting must be on Monday
+    * Meeting must be between 9:00 and 17:00
+    """
+).strip()
+
+
+@pytest.fixture
+def agent_env():
+    """Provide mocks and the ConstraintAgent built on them."""
+    mock_model = MagicMock(spec_set=BaseModelInterface)
+    mock_prompt_manager = MagicMock(spec_set=PromptManager)
+    mock_prompt_manager.get_system_message.return_value = (
+        "You are a constraint extraction agent"
+    )
+    mock_prompt_manager.get_prompt.return_value = "Extract constraints from: {problem}"
+
+    return SimpleNamespace(
+        model=mock_model,
+        prompt_manager=mock_prompt_manager,
+        agent=ConstraintAgent(model=mock_model, prompt_manager=mock_prompt_manager),
+    )
+
+
+class TestConstraintAgent:
     """Test cases for the ConstraintAgent class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.mock_model = MagicMock(spec=BaseModelInterface)
-        self.mock_prompt_manager = MagicMock(spec=PromptManager)
-        self.agent = ConstraintAgent(
-            model=self.mock_model, prompt_manager=self.mock_prompt_manager
-        )
-
-    def test_extract_constraints_extracts_correctly(self):
-        """Test that extract_constraints method extracts constraints correctly."""
-        # Mock prompt manager responses
-        self.mock_prompt_manager.get_system_message.return_value = (
-            "You are a constraint extraction agent"
-        )
-        self.mock_prompt_manager.get_prompt.return_value = (
-            "Extract constraints from: {problem}"
-        )
-
-        # Mock model response
-        self.mock_model.generate.return_value = """
-        1. Meeting duration must be 30 minutes
-        2. Meeting must be on Monday
-        3. Meeting must be between 9:00 and 17:00
-        4. All participants must be available
-        """
-
-        problem_statement = """
-        Schedule a 30-minute meeting for Alexander, Elizabeth, and Walter on Monday between 9:00 and 17:00.
-        """
-
-        constraints = self.agent.extract_constraints(problem_statement)
+    @pytest.mark.parametrize(
+        ("response", "expected"),
+        [
+            (
+                _RESPONSE_NUMBERED,
+                [
+                    "Meeting duration must be 30 minutes",
+                    "Meeting must be on Monday",
+                    "Meeting must be between 9:00 and 17:00",
+                    "All participants must be available",
+                ],
+            ),
+            (
+                _RESPONSE_MIXED,
+                [
+                    "Meeting duration must be 30 minutes",
+                    "Meeting must be on Monday",
+                    "Meeting must be between 9:00 and 17:00",
+                ],
+            ),
+        ],
+        ids=["numbered", "mixed"],
+    )
+    def test_extracts_constraints(self, agent_env, response, expected):
+        """Test that constraints are extracted and parsed across list formats."""
+        agent_env.model.generate.return_value = response
+
+        constraints = agent_env.agent.extract_constraints(_PROBLEM)
 
         # Check that the model was called with the correct prompt
-        self.mock_prompt_manager.get_system_message.assert_called_once_with(
+        agent_env.prompt_manager.get_system_message.assert_called_once_with(
             "constraint"
         )
-        self.mock_prompt_manager.get_prompt.assert_called_once()
-        self.mock_model.generate.assert_called_once()
+        agent_env.prompt_manager.get_prompt.assert_called_once()
+        agent_env.model.generate.assert_called_once()
 
         # Check that constraints were extracted correctly
-        self.assertIn("Meeting duration must be 30 minutes", constraints)
-        self.assertIn("Meeting must be on Monday", constraints)
-        self.assertIn("Meeting must be between 9:00 and 17:00", constraints)
-        self.assertIn("All participants must be available", constraints)
-
-    def test_extract_constraints_handles_different_formats(self):
-        """Test that extract_constraints method handles different constraint formats."""
-        # Mock prompt manager responses
-        self.mock_prompt_manager.get_system_message.return_value = (
-            "You are a constraint extraction agent"
-        )
-        self.mock_prompt_manager.get_prompt.return_value = (
-            "Extract constraints from: {problem}"
-        )
-
-        # Mock model response with different formats
-        self.mock_model.generate.return_value = """
-        1) Meeting duration must be 30 minutes
-        - Meeting must be on Monday
-        * Meeting must be between 9:00 and 17:00
-        """
-
-        problem_statement = """
-        Schedule a 30-minute meeting for Alexander, Elizabeth, and Walter on Monday between 9:00 and 17:00.
-        """
-
-        constraints = self.agent.extract_constraints(problem_statement)
+        for constraint in expected:
+            assert constraint in constraints
 
-        # Check that constraints were extracted correctly despite different formats
-        self.assertIn("Meeting duration must be 30 minutes", constraints)
-        self.assertIn("Meeting must be on Monday", constraints)
-        self.assertIn("Meeting must be between 9:00 and 17:00", constraints)
+        # Check that the list items parse out regardless of their marker
+        assert agent_env.agent.run(_PROBLEM) == expected
 
-    def test_extract_constraints_method_exists(self):
-        """Regression test for issue #25: Verify extract_constraints method exists."""
-        # Verify that the extract_constraints method exists
-        self.assertTrue(
-            hasattr(self.agent, 'extract_constraints'),
-            "ConstraintAgent must have extract_constraints method"
-        )
-        self.assertTrue(
-            callable(getattr(self.agent, 'extract_constraints')),
-            "extract_constraints must be callable"
-        )
-
-    def test_extract_constraints_returns_constraints(self):
+    def test_extract_constraints_returns_constraints(self, agent_env):
         """Regression test for issue #25: Verify extract_constraints returns expected constraints."""
-        # Mock prompt manager responses
-        self.mock_prompt_manager.get_system_message.return_value = (
-            "You are a constraint extraction agent"
-        )
-        self.mock_prompt_manager.get_prompt.return_value = (
-            "Extract constraints from: {problem}"
-        )
-
         # Mock model response
-        self.mock_model.generate.return_value = """
+        agent_env.model.generate.return_value = """
         1. Constraint one
         2. Constraint two
         3. Constraint three
@@ -118,13 +111,87 @@ class TestConstraintAgent(unittest.TestCase):
         problem_statement = "Test problem statement"
 
         # Call extract_constraints
-        result = self.agent.extract_constraints(problem_statement)
+        result = agent_env.agent.extract_constraints(problem_statement)
 
         # Verify the result contains expected constraints
-        self.assertIn("Constraint one", result)
-        self.assertIn("Constraint two", result)
-        self.assertIn("Constraint three", result)
+        assert "Constraint one" in result
+        assert "Constraint two" in result
+        assert "Constraint three" in result
+
+    def test_parse_constraints_falls_back_to_lines(self):
+        """Test that unnumbered constraints are split line by line."""
+        constraints = ConstraintAgent.parse_constraints("Constraint 1\n\nConstraint 2\n")
+
+        assert constraints == ["Constraint 1", "Constraint 2"]
+
+
+class TestConstraintAgentCache:
+    """Test cases for the opt-in constraint extraction cache."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_shared_cache(self):
+        ConstraintAgent.clear_cache()
+        yield
+        ConstraintAgent.clear_cache()
+
+    @staticmethod
+    def _make_agent(**kwargs):
+        mock_model = MagicMock(spec_set=BaseModelInterface)
+        mock_model.generate.return_value = _RESPONSE_NUMBERED
+        mock_prompt_manager = MagicMock(spec_set=PromptManager)
+        mock_prompt_manager.get_system_message.return_value = "System"
+        mock_prompt_manager.get_prompt.side_effect = (
+            lambda name, problem: f"Extract constraints from: {problem}"
+        )
+        return ConstraintAgent(
+            model=mock_model, prompt_manager=mock_prompt_manager, **kwargs
+        )
+
+    def test_repeated_problem_is_served_from_cache(self):
+        """Test that only the first extraction of a problem calls the model."""
+        agent = self._make_agent(use_cache=True)
+
+        first = agent.extract_constraints(_PROBLEM)
+        second = agent.extract_constraints(_PROBLEM)
+        agent.extract_constraints("Another problem")
+
+        assert first == second == _RESPONSE_NUMBERED
+        assert agent.model.generate.call_count == 2
+
+    def test_cache_is_disabled_by_default(self):
+        """Test that agents call the model every time unless caching is enabled."""
+        agent = self._make_agent()
+
+        agent.extract_constraints(_PROBLEM)
+        agent.extract_constraints(_PROBLEM)
+
+        assert agent.model.generate.call_count == 2
+
+    def test_cache_dir_persists_between_agents(self, tmp_path):
+        """Test that answers written to cache_dir are reused by a new agent."""
+        self._make_agent(cache_dir=tmp_path).extract_constraints(_PROBLEM)
+        agent = self._make_agent(cache_dir=tmp_path)
+
+        assert agent.extract_constraints(_PROBLEM) == _RESPONSE_NUMBERED
+        agent.model.generate.assert_not_called()
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+    def test_clear_cache_keeps_other_files(self, tmp_path):
+        """Test that clearing removes only the files the cache wrote."""
+        (tmp_path / "settings.json").write_text("{}")
+        agent = self._make_agent(cache_dir=tmp_path)
+        agent.extract_constraints(_PROBLEM)
+
+        agent.cache.clear()
+
+        assert [path.name for path in tmp_path.iterdir()] == ["settings.json"]
 
+    def test_unwritable_cache_dir_keeps_entry_in_memory(self, tmp_path):
+        """Test that failing to persist an answer does not fail extraction."""
+        cache_dir = tmp_path / "not_a_directory"
+        cache_dir.write_text("")
+        agent = self._make_agent(cache_dir=cache_dir)
 
-if __name__ == "__main__":
-    unittest.main()
+        assert agent.extract_constraints(_PROBLEM) == _RESPONSE_NUMBERED
+        assert agent.extract_constraints(_PROBLEM) == _RESPONSE_NUMBERED
+        assert agent.model.generate.call_count == 1
@@ -193,7 +193,9 @@ class TestPlanGEN:
         mock_model.generate.side_effect = [
             "Extracted constraints",  # For constraint extraction
             "Solution 1", "Solution 2", "Solution 3",  # For solution generation (num_solutions=3)
-            "Verification 1", "Verification 2", "Verification 3",  # For verification
+            # For verification (one batched response for all solutions)
+            "### Solution 1\nVerification 1\n### Solution 2\nVerification 2\n"
+            "### Solution 3\nVerification 3",
             "Solution 1",  # For selection
         ]
         mock_prompt_manager.get_system_message.return_value = "System message"
@@ -212,3 +214,74 @@ class TestPlanGEN:
         assert result["solutions"] == ["Solution 1", "Solution 2", "Solution 3"]
         assert result["verification_results"] == ["Verification 1", "Verification 2", "Verification 3"]
         assert "selected_solution" in result
+
+    @patch("plangen.plangen.PlanGEN._build_workflow")
+    def test_plan_cache(self, mock_build_workflow):
+        """Test that cached results are reused by solve and solve_stream."""
+        # Create PlanGEN with mock agents and a two-entry cache
+        plangen = PlanGEN(
+            model=MagicMock(),
+            prompt_manager=MagicMock(),
+            plan_cache_size=2,
+        )
+        plangen.constraint_agent = MagicMock()
+        plangen.constraint_agent.extract_constraints.return_value = "Constraints"
+        plangen.solution_agent = MagicMock()
+        plangen.solution_agent.generate_solutions.return_value = ["Solution 1"]
+        plangen.verification_agent = MagicMock()
+        plangen.verification_agent.verify_solutions.return_value = ["Verified"]
+        plangen.selection_agent = MagicMock()
+        plangen.selection_agent.select_best_solution.return_value = {
+            "selected_solution": "Solution 1",
+            "score": 0.9,
+        }
+        extract = plangen.constraint_agent.extract_constraints
+
+        # Repeated problems skip the workflow
+        first = plangen.solve("Problem A")
+        assert plangen.solve("Problem A") == first
+        assert extract.call_count == 1
+
+        # Hits are copies, so modifying a result leaves the cache intact
+        first["metadata"]["note"] = "changed"
+        first["solutions"].append("Solution 2")
+        hit = plangen.solve("Problem A")
+        assert hit is not first
+        assert hit["metadata"] == {}
+        assert hit["solutions"] == ["Solution 1"]
+
+        updates = list(plangen.solve_stream("Problem A"))
+        assert updates == [
+            {
+                "step": "cache_hit",
+                "status": "complete",
+                "data": {
+                    "constraints": "Constraints",
+                    "solutions": ["Solution 1"],
+                    "verification_results": ["Verified"],
+                    "selected_solution": first["selected_solution"],
+                    "score": 0.9,
+                },
+            }
+        ]
+        assert extract.call_count == 1
+
+        # Streamed results are cached too, and the oldest entry is evicted
+        list(plangen.solve_stream("Problem B"))
+        plangen.solve("Problem C")
+        assert extract.call_count == 3
+        plangen.solve("Problem B")
+        assert extract.call_count == 3
+        plangen.solve("Problem A")
+        assert extract.call_count == 4
+
+        # Failures are not cached
+        extract.side_effect = Exception("Constraint error")
+        assert plangen.solve("Problem D")["error"] is not None
+        assert plangen.solve("Problem D")["error"] is not None
+        assert extract.call_count == 6
+
+        plangen.clear_plan_cache()
+        extract.side_effect = None
+        plangen.solve("Problem A")
+        assert extract.call_count == 7
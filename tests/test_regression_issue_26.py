@@ -7,6 +7,7 @@ The VerificationAgent class was missing the verify_solutions method, which cause
 the simple_example.py to fail. This test ensures the bug doesn't reoccur.
 """
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
@@ -17,41 +18,41 @@ from plangen.models import BaseModelInterface
 from plangen.prompts import PromptManager
 
 
-class TestIssue26Regression:
-    """Regression tests for issue #26."""
+@pytest.fixture
+def plangen_env():
+    """Provide mocks and the VerificationAgent and PlanGEN built on them."""
+    mock_model = MagicMock(spec_set=BaseModelInterface)
+    mock_prompt_manager = MagicMock(spec_set=PromptManager)
+    mock_prompt_manager.get_system_message.return_value = "System message"
+    mock_prompt_manager.get_prompt.return_value = "Prompt"
 
-    def test_verification_agent_has_verify_solutions_method(self):
-        """Test that VerificationAgent has verify_solutions method with correct signature."""
-        # Create mock dependencies
-        mock_model = MagicMock(spec=BaseModelInterface)
-        mock_prompt_manager = MagicMock(spec=PromptManager)
+    return SimpleNamespace(
+        model=mock_model,
+        prompt_manager=mock_prompt_manager,
+        agent=VerificationAgent(mock_model, mock_prompt_manager),
+        plangen=PlanGEN(
+            model=mock_model, prompt_manager=mock_prompt_manager, num_solutions=3
+        ),
+    )
 
-        # Create agent
-        agent = VerificationAgent(mock_model, mock_prompt_manager)
 
-        # Verify method exists
-        assert hasattr(
-            agent, "verify_solutions"
-        ), "VerificationAgent must have verify_solutions method"
-        assert callable(agent.verify_solutions), "verify_solutions must be callable"
+class TestIssue26Regression:
+    """Regression tests for issue #26."""
 
-    def test_verification_agent_signature_matches_expected(self):
+    def test_verification_agent_signature_matches_expected(self, plangen_env):
         """Test that verify_solutions accepts expected parameters."""
-        mock_model = MagicMock(spec=BaseModelInterface)
-        mock_prompt_manager = MagicMock(spec=PromptManager)
-
         # Configure mocks
-        mock_model.generate.return_value = "Verification passed"
-        mock_prompt_manager.get_system_message.return_value = "System message"
-        mock_prompt_manager.get_prompt.return_value = "Prompt"
-
-        agent = VerificationAgent(mock_model, mock_prompt_manager)
+        plangen_env.model.generate.return_value = (
+            "### Solution 1\nVerification passed\n"
+            "### Solution 2\nVerification passed\n"
+            "### Solution 3\nVerification passed"
+        )
 
         # Call with the expected signature from PlanGEN._verify_solutions
         solutions = ["Solution 1", "Solution 2", "Solution 3"]
         constraints = "Test constraints"
 
-        result = agent.verify_solutions(solutions, constraints)
+        result = plangen_env.agent.verify_solutions(solutions, constraints)
 
         # Verify return type and content
         assert isinstance(result, list), "verify_solutions must return a list"
@@ -60,30 +61,13 @@ class TestIssue26Regression:
             r == "Verification passed" for r in result
         ), "All results should be verification strings"
 
-    def test_plangen_can_call_verification_agent_verify_solutions(self):
+    def test_plangen_can_call_verification_agent_verify_solutions(self, plangen_env):
         """Test that PlanGEN workflow can successfully call verify_solutions."""
-        # Create mocks
-        mock_model = MagicMock(spec=BaseModelInterface)
-        mock_prompt_manager = MagicMock(spec=PromptManager)
-
-        # Configure mocks to return proper values
-        mock_model.generate.side_effect = [
-            "Constraint 1\nConstraint 2",  # constraint extraction
-            "Solution 1",
-            "Solution 2",
-            "Solution 3",  # solution generation
-            "Verification 1",
-            "Verification 2",
-            "Verification 3",  # verification
-            "Solution 1 is best",  # selection
+        # Configure the batched verification response
+        plangen_env.model.generate.side_effect = [
+            "### Solution 1\nVerification 1\n### Solution 2\nVerification 2\n"
+            "### Solution 3\nVerification 3",
         ]
-        mock_prompt_manager.get_system_message.return_value = "System message"
-        mock_prompt_manager.get_prompt.return_value = "Prompt"
-
-        # Create PlanGEN instance
-        plangen = PlanGEN(
-            model=mock_model, prompt_manager=mock_prompt_manager, num_solutions=3
-        )
 
         # Create a state that triggers verification
         state = {
@@ -93,28 +77,29 @@ class TestIssue26Regression:
         }
 
         # Call _verify_solutions directly (this is what failed in issue #26)
-        result = plangen._verify_solutions(state)
+        result = plangen_env.plangen._verify_solutions(state)
 
         # Verify result
         assert "verification_results" in result, "Should return verification_results"
         assert isinstance(
             result["verification_results"], list
         ), "verification_results must be a list"
-        assert len(result["verification_results"]) == 3, "Should have 3 results"
+        assert result["verification_results"] == [
+            "Verification 1",
+            "Verification 2",
+            "Verification 3",
+        ], "Should have 3 results"
 
-    def test_agent_initialization_matches_plangen_expectations(self):
+    def test_agent_initialization_matches_plangen_expectations(self, plangen_env):
         """Test that VerificationAgent can be initialized as PlanGEN expects."""
         # This tests the exact initialization pattern used in PlanGEN.__init__
-        mock_model = MagicMock(spec=BaseModelInterface)
-        mock_prompt_manager = MagicMock(spec=PromptManager)
-
-        # This should not raise any errors
-        agent = VerificationAgent(mock_model, mock_prompt_manager)
+        agent = plangen_env.agent
 
         # Verify the agent has the expected attributes
         assert hasattr(agent, "model"), "Agent should have model attribute"
         assert hasattr(
             agent, "prompt_manager"
         ), "Agent should have prompt_manager attribute"
-        assert agent.model is mock_model
-        assert agent.prompt_manager is mock_prompt_manager
+        assert agent.model is plangen_env.model
+        assert agent.prompt_manager is plangen_env.prompt_manager
+        assert plangen_env.plangen.verification_agent.model is plangen_env.model
@@ -1,10 +1,17 @@
 """Tests for streaming functionality."""
 
+import asyncio
+import json
+import threading
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
-from plangen import PlanGEN
+import pytest
+
+from plangen import AgentResult, PlanGEN, StreamUpdate
 from plangen.api import PlanGen
 from plangen.models import OpenAIModelInterface
+from tests._util import bucket_updates
 
 
 class TestModelStreaming:
@@ -68,77 +75,134 @@ class TestModelStreaming:
 
         chunks = list(model.generate_stream("Test prompt"))
 
-        # Verify chunks
-        assert len(chunks) == 2
-        assert chunks[0] == "Hello "
-        assert chunks[1] == "world"
+        # Verify chunks (deltas may be coalesced, so compare the full text)
+        assert "".join(chunks) == "Hello world"
+        assert 1 <= len(chunks) <= 2
 
         # Verify API call
         mock_client.chat.completions.create.assert_called_once()
         call_args = mock_client.chat.completions.create.call_args
         assert call_args[1]["stream"] is True
 
+    @patch("plangen.models.openai_model.time.monotonic")
+    @patch("plangen.models.openai_model.OpenAI")
+    def test_openai_generate_stream_coalesces_fast_deltas(
+        self, mock_openai_class, mock_monotonic
+    ):
+        """Test that deltas after the first arriving within the flush interval are joined."""
+        mock_client = MagicMock()
+        mock_openai_class.return_value = mock_client
+        mock_monotonic.return_value = 0.0  # Every delta arrives instantly
+
+        deltas = ["a", "b", "c", "d", None]
+        chunks = []
+        for content in deltas:
+            chunk = MagicMock()
+            chunk.choices = [MagicMock()]
+            chunk.choices[0].delta.content = content
+            chunks.append(chunk)
+        mock_client.chat.completions.create.return_value = chunks
+
+        model = OpenAIModelInterface(model_name="gpt-4o", api_key="test-key")
+
+        assert list(model.generate_stream("Test prompt")) == ["a", "bcd"]
+
+    @patch("plangen.models.openai_model.STREAM_FLUSH_INTERVAL", 3600.0)
+    @patch("plangen.models.openai_model.STREAM_BUFFER_SIZE", 1 << 20)
+    @patch("plangen.models.openai_model.OpenAI")
+    def test_openai_generate_stream_yields_first_delta_immediately(
+        self, mock_openai_class
+    ):
+        """Test that the first delta bypasses the buffer regardless of its size."""
+        mock_client = MagicMock()
+        mock_openai_class.return_value = mock_client
+
+        chunks = []
+        for content in ["Hello", " big", " world"]:
+            chunk = MagicMock()
+            chunk.choices = [MagicMock()]
+            chunk.choices[0].delta.content = content
+            chunks.append(chunk)
+        mock_client.chat.completions.create.return_value = chunks
+
+        model = OpenAIModelInterface(model_name="gpt-4o", api_key="test-key")
+        stream = model.generate_stream("Test prompt")
+
+        assert next(stream) == "Hello"
+        assert list(stream) == [" big world"]
+
+
+# Compiling the PlanGEN workflow graph is the only costly setup here, so it is
+# built once per module and only the cheap agent mocks are reset per test.
+@pytest.fixture(scope="module")
+def _shared_stream_env():
+    """Build one PlanGEN and its mock agents for the module."""
+    plangen = PlanGEN(model=MagicMock(), prompt_manager=MagicMock(), num_solutions=2)
+    return SimpleNamespace(
+        plangen=plangen,
+        constraint_agent=MagicMock(),
+        solution_agent=MagicMock(),
+        verification_agent=MagicMock(),
+        selection_agent=MagicMock(),
+    )
+
+
+@pytest.fixture
+def stream_env(_shared_stream_env):
+    """Provide the shared PlanGEN wired to freshly reset mock agents."""
+    env = _shared_stream_env
+    for name in (
+        "constraint_agent",
+        "solution_agent",
+        "verification_agent",
+        "selection_agent",
+    ):
+        agent = getattr(env, name)
+        agent.reset_mock(return_value=True, side_effect=True)
+        setattr(env.plangen, name, agent)
+    return env
+
 
 class TestPlanGENStreaming:
     """Tests for PlanGEN-level streaming."""
 
-    def test_solve_stream_complete_workflow(self):
+    def test_solve_stream_complete_workflow(self, stream_env):
         """Test complete workflow streaming."""
-        # Setup mocks
-        mock_model = MagicMock()
-        mock_prompt_manager = MagicMock()
-        mock_constraint_agent = MagicMock()
-        mock_solution_agent = MagicMock()
-        mock_verification_agent = MagicMock()
-        mock_selection_agent = MagicMock()
-
         # Configure mock responses
-        mock_constraint_agent.extract_constraints.return_value = "Test constraints"
-        mock_solution_agent.generate_solutions.return_value = [
+        stream_env.constraint_agent.extract_constraints.return_value = (
+            "Test constraints"
+        )
+        stream_env.solution_agent.generate_solutions.return_value = [
             "Solution 1",
             "Solution 2",
         ]
-        mock_verification_agent.verify_solutions.return_value = [
+        stream_env.verification_agent.verify_solutions.return_value = [
             "Verification 1",
             "Verification 2",
         ]
-        mock_selection_agent.select_best_solution.return_value = {
+        stream_env.selection_agent.select_best_solution.return_value = {
             "selected_solution": "Solution 1",
             "score": 0.95,
         }
 
-        # Create PlanGEN instance
-        plangen = PlanGEN(
-            model=mock_model,
-            prompt_manager=mock_prompt_manager,
-            num_solutions=2,
-        )
-
-        # Replace agents with mocks
-        plangen.constraint_agent = mock_constraint_agent
-        plangen.solution_agent = mock_solution_agent
-        plangen.verification_agent = mock_verification_agent
-        plangen.selection_agent = mock_selection_agent
-
         # Test streaming
         problem = "Test problem"
-        updates = list(plangen.solve_stream(problem))
+        by_step = bucket_updates(stream_env.plangen.solve_stream(problem))
 
         # Verify we got all expected steps
-        step_names = [update["step"] for update in updates]
-        assert "extract_constraints" in step_names
-        assert "generate_solutions" in step_names
-        assert "verify_solutions" in step_names
-        assert "select_solution" in step_names
+        assert "extract_constraints" in by_step
+        assert "generate_solutions" in by_step
+        assert "verify_solutions" in by_step
+        assert "select_solution" in by_step
 
         # Verify each step has in_progress and complete status
-        constraint_updates = [u for u in updates if u["step"] == "extract_constraints"]
+        constraint_updates = by_step["extract_constraints"]
         assert len(constraint_updates) == 2
         assert constraint_updates[0]["status"] == "in_progress"
         assert constraint_updates[1]["status"] == "complete"
         assert constraint_updates[1]["data"]["constraints"] == "Test constraints"
 
-        solution_updates = [u for u in updates if u["step"] == "generate_solutions"]
+        solution_updates = by_step["generate_solutions"]
         assert len(solution_updates) == 2
         assert solution_updates[0]["status"] == "in_progress"
         assert solution_updates[1]["status"] == "complete"
@@ -147,12 +211,12 @@ class TestPlanGENStreaming:
             "Solution 2",
         ]
 
-        verification_updates = [u for u in updates if u["step"] == "verify_solutions"]
+        verification_updates = by_step["verify_solutions"]
         assert len(verification_updates) == 2
         assert verification_updates[0]["status"] == "in_progress"
         assert verification_updates[1]["status"] == "complete"
 
-        selection_updates = [u for u in updates if u["step"] == "select_solution"]
+        selection_updates = by_step["select_solution"]
         assert len(selection_updates) == 2
         assert selection_updates[0]["status"] == "in_progress"
         assert selection_updates[1]["status"] == "complete"
@@ -161,24 +225,13 @@ class TestPlanGENStreaming:
             == "Solution 1"
         )
 
-    def test_solve_stream_with_constraint_error(self):
+    def test_solve_stream_with_constraint_error(self, stream_env):
         """Test streaming with error in constraint extraction."""
-        # Setup mocks
-        mock_model = MagicMock()
-        mock_prompt_manager = MagicMock()
-        mock_constraint_agent = MagicMock()
-
         # Configure mock to raise error
-        mock_constraint_agent.extract_constraints.side_effect = Exception(
+        stream_env.constraint_agent.extract_constraints.side_effect = Exception(
             "Constraint error"
         )
-
-        # Create PlanGEN instance
-        plangen = PlanGEN(
-            model=mock_model,
-            prompt_manager=mock_prompt_manager,
-        )
-        plangen.constraint_agent = mock_constraint_agent
+        plangen = stream_env.plangen
 
         # Test streaming
         updates = list(plangen.solve_stream("Test problem"))
@@ -191,70 +244,80 @@ class TestPlanGENStreaming:
         assert updates[1]["status"] == "error"
         assert "Constraint error" in updates[1]["error"]
 
-    def test_solve_stream_with_solution_error(self):
-        """Test streaming with error in solution generation."""
-        # Setup mocks
-        mock_model = MagicMock()
-        mock_prompt_manager = MagicMock()
-        mock_constraint_agent = MagicMock()
-        mock_solution_agent = MagicMock()
+        # Updates are plain dicts, so they serialize and can be modified
+        assert json.loads(json.dumps(updates[0])) == updates[0]
+        updates[0]["status"] = "complete"
+        rerun = list(plangen.solve_stream("Test problem"))
+        assert rerun[0]["status"] == "in_progress"
 
-        # Configure mocks
-        mock_constraint_agent.extract_constraints.return_value = "Test constraints"
-        mock_solution_agent.generate_solutions.side_effect = Exception("Solution error")
+    def test_solve_stream_with_agent_result(self, stream_env):
+        """Test that agents can report errors by returning an AgentResult."""
+        stream_env.constraint_agent.extract_constraints.return_value = AgentResult(
+            ok=False, error="Constraint error"
+        )
+
+        updates = list(stream_env.plangen.solve_stream("Test problem"))
+
+        assert len(updates) == 2
+        assert updates[1]["status"] == "error"
+        assert updates[1]["error"] == (
+            "Error extracting constraints: Constraint error"
+        )
+
+        # A successful AgentResult is unwrapped to its value
+        stream_env.constraint_agent.extract_constraints.return_value = AgentResult(
+            ok=True, value="Extracted constraints"
+        )
+        stream_env.solution_agent.generate_solutions.side_effect = Exception(
+            "Solution error"
+        )
+
+        by_step = bucket_updates(stream_env.plangen.solve_stream("Test problem"))
 
-        # Create PlanGEN instance
-        plangen = PlanGEN(
-            model=mock_model,
-            prompt_manager=mock_prompt_manager,
+        assert by_step["extract_constraints"][1]["data"] == {
+            "constraints": "Extracted constraints"
+        }
+
+    def test_solve_stream_with_solution_error(self, stream_env):
+        """Test streaming with error in solution generation."""
+        # Configure mocks
+        stream_env.constraint_agent.extract_constraints.return_value = (
+            "Test constraints"
+        )
+        stream_env.solution_agent.generate_solutions.side_effect = Exception(
+            "Solution error"
         )
-        plangen.constraint_agent = mock_constraint_agent
-        plangen.solution_agent = mock_solution_agent
 
         # Test streaming
-        updates = list(plangen.solve_stream("Test problem"))
+        by_step = bucket_updates(stream_env.plangen.solve_stream("Test problem"))
 
         # Find solution generation updates
-        solution_updates = [u for u in updates if u["step"] == "generate_solutions"]
+        solution_updates = by_step["generate_solutions"]
 
         # Verify error was captured
         assert len(solution_updates) == 2
         assert solution_updates[1]["status"] == "error"
         assert "Solution error" in solution_updates[1]["error"]
 
-    def test_solve_stream_with_verification_error(self):
+    def test_solve_stream_with_verification_error(self, stream_env):
         """Test streaming with error in solution verification."""
-        # Setup mocks
-        mock_model = MagicMock()
-        mock_prompt_manager = MagicMock()
-        mock_constraint_agent = MagicMock()
-        mock_solution_agent = MagicMock()
-        mock_verification_agent = MagicMock()
-
         # Configure mocks
-        mock_constraint_agent.extract_constraints.return_value = "Test constraints"
-        mock_solution_agent.generate_solutions.return_value = [
+        stream_env.constraint_agent.extract_constraints.return_value = (
+            "Test constraints"
+        )
+        stream_env.solution_agent.generate_solutions.return_value = [
             "Solution 1",
             "Solution 2",
         ]
-        mock_verification_agent.verify_solutions.side_effect = Exception(
+        stream_env.verification_agent.verify_solutions.side_effect = Exception(
             "Verification error"
         )
 
-        # Create PlanGEN instance
-        plangen = PlanGEN(
-            model=mock_model,
-            prompt_manager=mock_prompt_manager,
-        )
-        plangen.constraint_agent = mock_constraint_agent
-        plangen.solution_agent = mock_solution_agent
-        plangen.verification_agent = mock_verification_agent
-
         # Test streaming
-        updates = list(plangen.solve_stream("Test problem"))
+        by_step = bucket_updates(stream_env.plangen.solve_stream("Test problem"))
 
         # Find verification updates
-        verification_updates = [u for u in updates if u["step"] == "verify_solutions"]
+        verification_updates = by_step["verify_solutions"]
 
         # Verify error was captured
         assert len(verification_updates) == 2
@@ -269,45 +332,29 @@ class TestPlanGENStreaming:
             "Solution 2",
         ]
 
-    def test_solve_stream_with_selection_error(self):
+    def test_solve_stream_with_selection_error(self, stream_env):
         """Test streaming with error in solution selection."""
-        # Setup mocks
-        mock_model = MagicMock()
-        mock_prompt_manager = MagicMock()
-        mock_constraint_agent = MagicMock()
-        mock_solution_agent = MagicMock()
-        mock_verification_agent = MagicMock()
-        mock_selection_agent = MagicMock()
-
         # Configure mocks
-        mock_constraint_agent.extract_constraints.return_value = "Test constraints"
-        mock_solution_agent.generate_solutions.return_value = [
+        stream_env.constraint_agent.extract_constraints.return_value = (
+            "Test constraints"
+        )
+        stream_env.solution_agent.generate_solutions.return_value = [
             "Solution 1",
             "Solution 2",
         ]
-        mock_verification_agent.verify_solutions.return_value = [
+        stream_env.verification_agent.verify_solutions.return_value = [
             "Verification 1",
             "Verification 2",
         ]
-        mock_selection_agent.select_best_solution.side_effect = Exception(
+        stream_env.selection_agent.select_best_solution.side_effect = Exception(
             "Selection error"
         )
 
-        # Create PlanGEN instance
-        plangen = PlanGEN(
-            model=mock_model,
-            prompt_manager=mock_prompt_manager,
-        )
-        plangen.constraint_agent = mock_constraint_agent
-        plangen.solution_agent = mock_solution_agent
-        plangen.verification_agent = mock_verification_agent
-        plangen.selection_agent = mock_selection_agent
-
         # Test streaming
-        updates = list(plangen.solve_stream("Test problem"))
+        by_step = bucket_updates(stream_env.plangen.solve_stream("Test problem"))
 
         # Find selection updates
-        selection_updates = [u for u in updates if u["step"] == "select_solution"]
+        selection_updates = by_step["select_solution"]
 
         # Verify error was captured
         assert len(selection_updates) == 2
@@ -326,6 +373,126 @@ class TestPlanGENStreaming:
             "Verification 2",
         ]
 
+    def test_solve_stream_without_copying_data(self, stream_env):
+        """Test that copy_data=False shares one growing data dict across updates."""
+        # Configure mocks
+        stream_env.constraint_agent.extract_constraints.return_value = (
+            "Test constraints"
+        )
+        stream_env.solution_agent.generate_solutions.return_value = ["Solution 1"]
+        stream_env.verification_agent.verify_solutions.return_value = [
+            "Verification 1"
+        ]
+        stream_env.selection_agent.select_best_solution.return_value = {
+            "selected_solution": "Solution 1",
+            "score": 0.9,
+        }
+
+        # Test streaming
+        updates = list(
+            stream_env.plangen.solve_stream("Test problem", copy_data=False)
+        )
+        complete = [u for u in updates if u["status"] == "complete"]
+
+        # Every complete update references the same, fully populated dict
+        assert len(complete) == 4
+        assert all(u["data"] is complete[-1]["data"] for u in complete)
+        assert complete[0]["data"]["score"] == 0.9
+
+        # The default gives each update its own snapshot
+        copied = [
+            u
+            for u in stream_env.plangen.solve_stream("Test problem")
+            if u["status"] == "complete"
+        ]
+        assert "solutions" not in copied[0]["data"]
+        assert copied[-1]["data"] == complete[-1]["data"]
+
+    def test_solve_stream_tuple_format(self, stream_env):
+        """Test that stream_format="tuple" yields StreamUpdate tuples."""
+        # Configure mocks
+        stream_env.constraint_agent.extract_constraints.return_value = (
+            "Test constraints"
+        )
+        stream_env.solution_agent.generate_solutions.side_effect = Exception(
+            "Solution error"
+        )
+
+        # Test streaming
+        updates = list(
+            stream_env.plangen.solve_stream("Test problem", stream_format="tuple")
+        )
+
+        assert all(isinstance(u, StreamUpdate) for u in updates)
+        assert updates[0] == StreamUpdate("extract_constraints", "in_progress")
+        assert updates[1].data == {"constraints": "Test constraints"}
+        assert updates[1].error is None
+        assert updates[-1].status == "error"
+        assert "Solution error" in updates[-1].error
+
+        # Same content as the default dict format
+        dict_updates = list(stream_env.plangen.solve_stream("Test problem"))
+        assert [
+            {k: v for k, v in u._asdict().items() if v is not None or k == "data"}
+            for u in updates
+        ] == dict_updates
+
+        with pytest.raises(ValueError, match="Unsupported stream format"):
+            next(stream_env.plangen.solve_stream("Test problem", stream_format="xml"))
+
+    def test_solve_stream_async_matches_sync_updates(self, stream_env):
+        """Test that async streaming yields the same updates as solve_stream."""
+        # Configure mocks
+        stream_env.constraint_agent.extract_constraints.return_value = (
+            "Test constraints"
+        )
+        stream_env.solution_agent.generate_solutions.return_value = ["Solution 1"]
+        stream_env.verification_agent.verify_solutions.return_value = [
+            "Verification 1"
+        ]
+        stream_env.selection_agent.select_best_solution.return_value = {
+            "selected_solution": "Solution 1",
+        }
+        plangen = stream_env.plangen
+
+        async def collect():
+            return [u async for u in plangen.solve_stream_async("Test problem")]
+
+        # Test streaming
+        async_updates = asyncio.run(collect())
+        sync_updates = list(plangen.solve_stream("Test problem"))
+
+        assert async_updates == sync_updates
+        assert async_updates[-1]["step"] == "select_solution"
+        assert async_updates[-1]["status"] == "complete"
+
+    def test_solve_stream_async_stops_when_consumer_exits(self, stream_env):
+        """Test that closing the async stream early skips the remaining steps."""
+        release = threading.Event()
+
+        def extract_constraints(problem):
+            release.wait(5)
+            return "Extracted constraints"
+
+        stream_env.constraint_agent.extract_constraints.side_effect = (
+            extract_constraints
+        )
+
+        async def take_first():
+            stream = stream_env.plangen.solve_stream_async("Test problem")
+            first = await stream.__anext__()
+            await stream.aclose()
+            release.set()
+            return first
+
+        first = asyncio.run(take_first())
+
+        assert first["step"] == "extract_constraints"
+        assert first["status"] == "in_progress"
+        stream_env.constraint_agent.extract_constraints.assert_called_once()
+        stream_env.solution_agent.generate_solutions.assert_not_called()
+        stream_env.verification_agent.verify_solutions.assert_not_called()
+
 
 class TestAPIStreaming:
     """Tests for API-level streaming."""
@@ -1,9 +1,11 @@
 """Tests for type definitions in plangen.types module."""
 
+import json
+
 import pytest
 
 from plangen.types import (AlgorithmResult, PlanResult, SolveResult,
-                           VerificationResult)
+                           VerificationResult, make_solve_result)
 
 
 class TestVerificationResult:
@@ -108,6 +110,25 @@ class TestSolveResult:
         assert result["verification_results"] is None
         assert result["error"] is not None
 
+    def test_make_solve_result_defaults_omitted_fields(self):
+        """Test that make_solve_result fills in fields it is not given."""
+        result = make_solve_result("Test problem", constraints="Some constraints")
+
+        assert result == SolveResult(
+            problem="Test problem",
+            constraints="Some constraints",
+            solutions=None,
+            verification_results=None,
+            selected_solution=None,
+            score=None,
+            metadata={},
+            error=None,
+        )
+        assert make_solve_result("Test problem").metadata is not result.metadata
+
+        with pytest.raises(TypeError):
+            make_solve_result("Test problem", unknown_field=1)
+
 
 class TestAlgorithmResult:
     """Tests for AlgorithmResult TypedDict."""
@@ -176,6 +197,50 @@ class TestPlanResult:
         assert result["score"] == 60.0
 
 
+class TestResultAccess:
+    """Tests for attribute and backward-compatible key access on results."""
+
+    def test_attribute_and_key_access_agree(self):
+        """Test that fields are readable as attributes and by key."""
+        result = VerificationResult(
+            is_valid=True, score=85.5, reason="OK", feedback=None
+        )
+
+        assert result.score == result["score"] == result.get("score") == 85.5
+        assert "feedback" in result
+        assert "missing" not in result
+        assert result.get("missing", "default") == "default"
+        with pytest.raises(KeyError):
+            result["missing"]
+
+    def test_result_compares_equal_to_dict(self):
+        """Test that results convert to and compare equal with plain dicts."""
+        result = PlanResult(
+            problem="Problem", selected_solution="Plan", score=1.0, metadata={}
+        )
+        expected = {
+            "problem": "Problem",
+            "selected_solution": "Plan",
+            "score": 1.0,
+            "metadata": {},
+        }
+
+        assert result == expected
+        assert dict(result) == expected
+        assert result.to_dict() == expected
+        assert list(result) == list(expected)
+        assert len(result) == len(expected)
+        assert list(result.items()) == list(expected.items())
+        assert list(result.values()) == list(expected.values())
+        assert json.loads(json.dumps(result.to_dict())) == expected
+
+    def test_results_are_slotted(self):
+        """Test that result instances carry no per-instance __dict__."""
+        result = AlgorithmResult(best_plan="Plan", score=1.0, metadata={})
+
+        assert not hasattr(result, "__dict__")
+
+
 class TestTypeImports:
     """Tests for importing types from plangen package."""
 
@@ -2,13 +2,17 @@
 Tests for the visualization module.
 """
 
+import json
 import os
 import tempfile
 import unittest
+from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import networkx as nx
+import numpy as np
 
+from plangen.types import VerificationResult
 from plangen.visualization import GraphRenderer, Observable, PlanObserver
 
 
@@ -98,6 +102,46 @@ class TestGraphRenderer(unittest.TestCase):
         self.assertIn("node1", self.renderer.graph.nodes)
         self.assertEqual(self.renderer.graph.nodes["node1"]["score"], 0.8)
 
+    def test_update_tree_of_thought_graph_batch(self):
+        """Test that a depth's nodes are added together with their edges."""
+        self.renderer.algorithm_type = "TreeOfThought"
+        self.renderer.update(
+            {"new_nodes": [{"id": "root", "steps": [], "score": 0, "depth": 0}]}
+        )
+
+        self.renderer.update(
+            {
+                "new_nodes": [
+                    {"id": "a", "parent_id": "root", "score": 0.5, "depth": 1},
+                    {"id": "b", "parent_id": "a", "score": 0.7, "depth": 2},
+                    {"id": "c", "parent_id": "missing", "score": 0.1, "depth": 1},
+                ]
+            }
+        )
+
+        self.assertEqual(set(self.renderer.graph.nodes), {"root", "a", "b", "c"})
+        self.assertEqual(
+            set(self.renderer.graph.edges), {("root", "a"), ("a", "b")}
+        )
+        self.assertEqual(self.renderer.graph.nodes["b"]["score"], 0.7)
+
+    def test_tree_of_thought_colors_match_per_node_colors(self):
+        """Test that batch color computation matches the per-node path."""
+        self.renderer.algorithm_type = "TreeOfThought"
+        for i, score in enumerate([-0.5, 0.0, 0.25, 0.5, 0.8, 1.5]):
+            self.renderer.graph.add_node(f"n{i}", score=score, depth=1, steps=["s"])
+        self.renderer.graph.add_node("done", score=0.9, complete=True)
+
+        labels, colors = self.renderer._create_tree_of_thought_labels_and_colors()
+
+        for node, color in zip(self.renderer.graph.nodes, colors):
+            expected = self.renderer._create_node_label_and_color(
+                node, self.renderer.graph.nodes[node]
+            )
+            self.assertEqual((labels[node], color), expected)
+        self.assertEqual(colors[-1], "green")
+        self.assertEqual(colors[2], (1.0, 0.5, 0.0))
+
     def test_update_rebase_graph(self):
         """Test updating a REBASE graph."""
         # Set algorithm type
@@ -132,6 +176,50 @@ class TestGraphRenderer(unittest.TestCase):
         # Check that file exists
         self.assertTrue(os.path.exists(filepath))
 
+    def test_save_graph_data_without_orjson(self):
+        """Test that the json fallback writes the same document as orjson."""
+        self.renderer.graph.add_node(
+            "a",
+            score=0.5,
+            created=object,
+            depth=np.int64(3),
+            scores=np.array([1, 2]),
+            weight=np.float32(0.5),
+            created_at=datetime(2024, 1, 2, 3, 4, 5),
+            verification=VerificationResult(
+                is_valid=True, score=90.0, reason="OK", feedback=None
+            ),
+            spread=float("nan"),
+            history=np.array([0.5, np.nan]),
+        )
+        self.renderer.graph.add_node("b", score=0.75)
+        self.renderer.graph.add_edge("a", "b")
+
+        filepath = self.renderer.save_graph_data(filename="default.json")
+        with patch("plangen.visualization.graph_renderer.orjson", None):
+            fallback_path = self.renderer.save_graph_data(filename="fallback.json")
+
+        with open(filepath) as f:
+            data = json.load(f)
+        with open(fallback_path) as f:
+            # NaN and infinities must not be written as bare constants
+            self.assertEqual(json.load(f, parse_constant=self.fail), data)
+
+        self.assertEqual(data["nodes"][0]["data"]["created"], str(object))
+        self.assertEqual(data["nodes"][0]["data"]["depth"], 3)
+        self.assertEqual(data["nodes"][0]["data"]["scores"], [1, 2])
+        self.assertEqual(data["nodes"][0]["data"]["weight"], 0.5)
+        self.assertEqual(
+            data["nodes"][0]["data"]["created_at"], "2024-01-02 03:04:05"
+        )
+        self.assertEqual(
+            data["nodes"][0]["data"]["verification"],
+            str(self.renderer.graph.nodes["a"]["verification"]),
+        )
+        self.assertIsNone(data["nodes"][0]["data"]["spread"])
+        self.assertEqual(data["nodes"][0]["data"]["history"], [0.5, None])
+        self.assertEqual(data["edges"], [{"source": "a", "target": "b"}])
+
     @patch("matplotlib.pyplot.savefig")
     @patch("matplotlib.pyplot.figure")
     def test_render(self, mock_figure, mock_savefig):
@@ -6,58 +6,68 @@ ensuring proper observer pattern implementation and graph rendering.
 """
 
 import os
-import tempfile
-import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import DEFAULT, MagicMock, patch
 
 import networkx as nx
+import pytest
 
 from plangen.algorithms import BestOfN, MixtureOfAlgorithms, REBASE, TreeOfThought
 from plangen.visualization import GraphRenderer
 
+# Sample problem statement for all tests
+PROBLEM_STATEMENT = "Plan a simple event."
 
-class TestAlgorithmVisualizations(unittest.TestCase):
+
+@pytest.fixture(scope="module")
+def llm_mock():
+    """Mock LLM interface that returns predictable responses."""
+    mock = MagicMock()
+    mock.generate.return_value = "Mock plan output"
+    return mock
+
+
+@pytest.fixture(scope="module")
+def constraint_agent_mock():
+    """Mock constraint agent that returns predictable constraints."""
+    mock = MagicMock()
+    mock.run.return_value = ["Constraint 1", "Constraint 2"]
+    return mock
+
+
+@pytest.fixture(scope="module")
+def verification_agent_mock():
+    """Mock verification agent that returns predictable scores."""
+    mock = MagicMock()
+    mock.run.return_value = ("Good plan", 75.0)
+    return mock
+
+
+class TestAlgorithmVisualizations:
     """Test suite for algorithm visualizations."""
 
-    def setUp(self):
+    @pytest.fixture(autouse=True)
+    def _setup(
+        self, tmp_path, llm_mock, constraint_agent_mock, verification_agent_mock
+    ):
         """Set up test environment."""
-        # Create a temporary directory for visualization outputs
-        self.temp_dir = tempfile.mkdtemp()
-        
-        # Create a renderer with auto_render disabled for tests
-        self.renderer = GraphRenderer(
-            output_dir=self.temp_dir,
-            auto_render=False
-        )
-        
-        # Create a mock LLM interface that returns predictable responses
-        self.llm_mock = MagicMock()
-        self.llm_mock.generate.return_value = "Mock plan output"
-        
-        # Mock constraint agent to return predictable constraints
-        self.constraint_agent_mock = MagicMock()
-        self.constraint_agent_mock.run.return_value = [
-            "Constraint 1", 
-            "Constraint 2"
-        ]
-        
-        # Mock verification agent to return predictable scores
-        self.verification_agent_mock = MagicMock()
-        self.verification_agent_mock.run.return_value = ("Good plan", 75.0)
-        
-        # Sample problem statement for all tests
-        self.problem_statement = "Plan a simple event."
+        # Create a renderer with auto_render disabled for tests; pytest
+        # removes tmp_path afterwards
+        self.renderer = GraphRenderer(output_dir=str(tmp_path), auto_render=False)
+
+        self.llm_mock = llm_mock
+        self.constraint_agent_mock = constraint_agent_mock
+        self.verification_agent_mock = verification_agent_mock
+        self.problem_statement = PROBLEM_STATEMENT
 
-    def tearDown(self):
-        """Clean up after tests."""
-        # Clean up temporary directory
-        for file in os.listdir(self.temp_dir):
-            os.remove(os.path.join(self.temp_dir, file))
-        os.rmdir(self.temp_dir)
+        # Patch pyplot once per test instead of decorating every test
+        with patch.multiple(
+            "matplotlib.pyplot", savefig=DEFAULT, close=DEFAULT
+        ) as pyplot_mocks:
+            self.savefig_mock = pyplot_mocks["savefig"]
+            self.close_mock = pyplot_mocks["close"]
+            yield
 
-    @patch('matplotlib.pyplot.savefig')
-    @patch('matplotlib.pyplot.close')
-    def test_tree_of_thought_visualization(self, mock_close, mock_savefig):
+    def test_tree_of_thought_visualization(self):
         """Test visualization of TreeOfThought algorithm."""
         # Initialize algorithm with mocks
         algorithm = TreeOfThought(
@@ -76,21 +86,19 @@ class TestAlgorithmVisualizations(unittest.TestCase):
         algorithm.run(self.problem_statement)
         
         # Verify graph was updated with correct algorithm type
-        self.assertEqual(self.renderer.algorithm_type, "TreeOfThought")
+        assert self.renderer.algorithm_type == "TreeOfThought"
         
         # Check that graph has nodes
-        self.assertGreater(len(self.renderer.graph.nodes), 0)
+        assert len(self.renderer.graph.nodes) > 0
         
         # Render the graph
         self.renderer.render(save=True, display=False)
         
         # Check that savefig was called
-        mock_savefig.assert_called_once()
-        mock_close.assert_called_once()
+        self.savefig_mock.assert_called_once()
+        self.close_mock.assert_called_once()
 
-    @patch('matplotlib.pyplot.savefig')
-    @patch('matplotlib.pyplot.close')
-    def test_rebase_visualization(self, mock_close, mock_savefig):
+    def test_rebase_visualization(self):
         """Test visualization of REBASE algorithm."""
         # Initialize algorithm with mocks
         algorithm = REBASE(
@@ -108,27 +116,25 @@ class TestAlgorithmVisualizations(unittest.TestCase):
         algorithm.run(self.problem_statement)
         
         # Verify graph was updated with correct algorithm type
-        self.assertEqual(self.renderer.algorithm_type, "REBASE")
+        assert self.renderer.algorithm_type == "REBASE"
         
         # Check that graph has nodes
-        self.assertGreater(len(self.renderer.graph.nodes), 0)
+        assert len(self.renderer.graph.nodes) > 0
         
         # Check that nodes have expected attributes
         for node, attrs in self.renderer.graph.nodes(data=True):
             if node.startswith("iteration_"):
-                self.assertIn("score", attrs)
-                self.assertIn("feedback", attrs)
+                assert "score" in attrs
+                assert "feedback" in attrs
         
         # Render the graph
         self.renderer.render(save=True, display=False)
         
         # Check that savefig was called
-        mock_savefig.assert_called_once()
-        mock_close.assert_called_once()
+        self.savefig_mock.assert_called_once()
+        self.close_mock.assert_called_once()
 
-    @patch('matplotlib.pyplot.savefig')
-    @patch('matplotlib.pyplot.close')
-    def test_best_of_n_visualization(self, mock_close, mock_savefig):
+    def test_best_of_n_visualization(self):
         """Test visualization of BestOfN algorithm."""
         # Initialize algorithm with mocks
         algorithm = BestOfN(
@@ -146,33 +152,31 @@ class TestAlgorithmVisualizations(unittest.TestCase):
         algorithm.run(self.problem_statement)
         
         # Verify graph was updated with correct algorithm type
-        self.assertEqual(self.renderer.algorithm_type, "BestOfN")
+        assert self.renderer.algorithm_type == "BestOfN"
         
         # Check that graph has nodes
-        self.assertGreater(len(self.renderer.graph.nodes), 0)
+        assert len(self.renderer.graph.nodes) > 0
         
         # Check that central node exists
-        self.assertIn("best_of_n_root", self.renderer.graph.nodes)
+        assert "best_of_n_root" in self.renderer.graph.nodes
         
         # Check plan nodes have expected attributes
         plan_nodes = [n for n in self.renderer.graph.nodes if n.startswith("plan_")]
-        self.assertGreaterEqual(len(plan_nodes), 1)
+        assert len(plan_nodes) >= 1
         
         for node in plan_nodes:
             attrs = self.renderer.graph.nodes[node]
-            self.assertIn("score", attrs)
-            self.assertIn("plan", attrs)
+            assert "score" in attrs
+            assert "plan" in attrs
         
         # Render the graph
         self.renderer.render(save=True, display=False)
         
         # Check that savefig was called
-        mock_savefig.assert_called_once()
-        mock_close.assert_called_once()
+        self.savefig_mock.assert_called_once()
+        self.close_mock.assert_called_once()
 
-    @patch('matplotlib.pyplot.savefig')
-    @patch('matplotlib.pyplot.close')
-    def test_mixture_of_algorithms_visualization(self, mock_close, mock_savefig):
+    def test_mixture_of_algorithms_visualization(self):
         """Test visualization of MixtureOfAlgorithms approach."""
         # Initialize algorithm with mocks
         algorithm = MixtureOfAlgorithms(
@@ -193,24 +197,24 @@ class TestAlgorithmVisualizations(unittest.TestCase):
         algorithm.run(self.problem_statement)
         
         # Verify graph was updated with correct algorithm type
-        self.assertEqual(self.renderer.algorithm_type, "MixtureOfAlgorithms")
+        assert self.renderer.algorithm_type == "MixtureOfAlgorithms"
         
         # Check that graph has nodes
-        self.assertGreater(len(self.renderer.graph.nodes), 0)
+        assert len(self.renderer.graph.nodes) > 0
         
         # Check that algorithm selection nodes exist
         algo_nodes = [
             n for n, a in self.renderer.graph.nodes(data=True) 
             if a.get("type") == "algorithm"
         ]
-        self.assertGreaterEqual(len(algo_nodes), 1)
+        assert len(algo_nodes) >= 1
         
         # Render the graph
         self.renderer.render(save=True, display=False)
         
         # Check that savefig was called
-        mock_savefig.assert_called_once()
-        mock_close.assert_called_once()
+        self.savefig_mock.assert_called_once()
+        self.close_mock.assert_called_once()
 
     def test_save_graph_data(self):
         """Test saving graph data as JSON."""
@@ -234,11 +238,7 @@ class TestAlgorithmVisualizations(unittest.TestCase):
         file_path = self.renderer.save_graph_data(filename="test_data.json")
         
         # Check that file exists
-        self.assertTrue(os.path.exists(file_path))
+        assert os.path.exists(file_path)
         
         # Check file has non-zero size
-        self.assertGreater(os.path.getsize(file_path), 0)
-
-
-if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+        assert os.path.getsize(file_path) > 0